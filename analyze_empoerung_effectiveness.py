@@ -1,19 +1,22 @@
 import sys
-import sqlite3
 import statistics
+from sqlalchemy import text
+
+from app import app, db
 
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
-conn = sqlite3.connect(r'C:\Users\Jason\Desktop\Masterarbeit\Twitter-Auswertung\instance\twitter_ter.db')
-cursor = conn.cursor()
+# Gleiche Datenbank wie die App (DATABASE_URL, Standard: instance/twitter_ter.db)
+app.app_context().push()
+conn = db.engine.connect()
 
 print("=" * 80)
 print("ANALYSE: WARUM HAT EMPÖRUNG NIEDRIGE TRIGGER-EFFEKTIVITÄT?")
 print("=" * 80)
 
 # Get posts with and without Empörung
-cursor.execute('''
+result = conn.execute(text('''
     SELECT
         id,
         trigger_empoerung,
@@ -25,10 +28,10 @@ cursor.execute('''
         trigger_identitaet,
         trigger_hoffnung
     FROM twitter_posts
-    WHERE is_reviewed = 1 AND is_excluded = 0
-''')
+    WHERE is_reviewed = TRUE AND is_excluded = FALSE
+'''))
 
-posts = cursor.fetchall()
+posts = result.fetchall()
 
 posts_with_empoerung = []
 posts_without_empoerung = []
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Excel-Export der reviewed Posts - build_reviewed_excel (write-only) vs. build_reviewed_excel_legacy
+
+Fuer jede Groesse:
+1. N transiente Posts erzeugen (mit Inhalt, Triggern/Frames und Notizen wie im Review)
+2. Beide Varianten bauen und speichern das Workbook in einen BytesIO-Puffer
+3. Laufzeit, Speicher-Spitze (max. RSS, jede Messung in einem eigenen Prozess) und Dateigroesse ausgeben
+
+Die Legacy-Variante waechst quadratisch (merge_cells prueft jeden Bereich gegen alle bisherigen),
+Messungen ueber --timeout Sekunden werden abgebrochen.
+
+Aufruf: python benchmark_excel_export.py [--sizes 1000 10000 50000] [--timeout 600]
+"""
+
+import argparse
+import io
+import random
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from app import TwitterPost, build_reviewed_excel
+from test_excel_export import build_reviewed_excel_legacy
+
+
+def make_posts(count, seed=1):
+    rnd = random.Random(seed)
+    posts = []
+    for i in range(count):
+        views = rnd.randint(100, 500000)
+        posts.append(TwitterPost(
+            id=i + 1,
+            twitter_url=f'https://twitter.com/user{i % 500}/status/{10 ** 15 + i}',
+            twitter_author=f'Autor {i % 500}',
+            twitter_handle=f'user{i % 500}',
+            twitter_followers=rnd.randint(0, 10 ** 6),
+            twitter_content=' '.join(f'Wort{j}' for j in range(rnd.randint(5, 60))),
+            twitter_date='2023-05-07',
+            access_date='01.02.2024',
+            likes=rnd.randint(0, 5000), retweets=rnd.randint(0, 500), replies=rnd.randint(0, 500),
+            bookmarks=rnd.randint(0, 200), quotes=rnd.randint(0, 100), views=views,
+            ter_automatic=round(rnd.uniform(0, 30), 2), ter_linear=round(rnd.uniform(0, 5), 2),
+            ter_manual=round(rnd.uniform(0, 30), 2),
+            weighted_engagement=rnd.randint(0, 9000), total_interactions=rnd.randint(0, 6000),
+            engagement_level='Hohes Engagement',
+            trigger_angst=rnd.randint(0, 5), trigger_wut=rnd.randint(0, 5), trigger_empoerung=rnd.randint(0, 5),
+            trigger_ekel=0, trigger_identitaet=rnd.randint(0, 5), trigger_hoffnung=0,
+            frame_opfer_taeter=rnd.randint(0, 1), frame_bedrohung=rnd.randint(0, 1), frame_verschwoerung=0,
+            frame_moral=rnd.randint(0, 1), frame_historisch=0,
+            notes='Notiz' if i % 4 == 0 else None
+        ))
+    return posts
+
+
+VARIANTS = {
+    'write-only': build_reviewed_excel,
+    'legacy': build_reviewed_excel_legacy
+}
+
+
+def measure(variant, size):
+    """Baut und speichert ein Workbook im aktuellen Prozess; gibt "Sekunden|Peak-MB|Datei-MB" aus"""
+    posts = make_posts(size)
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    buffer = io.BytesIO()
+    VARIANTS[variant](posts, datetime.now()).save(buffer)
+    elapsed = time.perf_counter() - started
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{elapsed}|{(peak_kb - baseline_kb) / 1024}|{buffer.getbuffer().nbytes / 1e6}")
+
+
+def run_measurement(variant, size, timeout):
+    """Misst eine Variante in einem frischen Prozess (Speicher-Spitze unabhaengig von vorherigen Laeufen)"""
+    output = subprocess.run(
+        [sys.executable, __file__, '--measure', variant, str(size)],
+        capture_output=True, text=True, check=True, timeout=timeout
+    ).stdout.strip().splitlines()[-1]
+    return [float(value) for value in output.split('|')]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--timeout', type=float, default=600,
+                        help='Abbruch einer Messung nach dieser Zeit in Sekunden')
+    parser.add_argument('--measure', nargs=2, metavar=('VARIANTE', 'POSTS'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure[0], int(args.measure[1]))
+        return
+
+    print("\n" + "=" * 80)
+    print("BENCHMARK: Excel-Export (reviewed Posts)")
+    print("=" * 80)
+    print(f"{'Posts':>8} {'Variante':<12} {'Zeit (s)':>10} {'Peak (MB)':>10} {'Datei (MB)':>11}")
+    for size in args.sizes:
+        for variant in VARIANTS:
+            try:
+                elapsed, peak_mb, size_mb = run_measurement(variant, size, args.timeout)
+            except subprocess.TimeoutExpired:
+                print(f"{size:>8} {variant:<12} {'> ' + format(args.timeout, '.0f'):>10} {'-':>10} {'-':>11}  (abgebrochen)")
+                continue
+            except subprocess.CalledProcessError as e:
+                error = e.stderr.strip().splitlines()[-1] if e.stderr.strip() else f'Exit-Code {e.returncode}'
+                print(f"{size:>8} {variant:<12} {'-':>10} {'-':>10} {'-':>11}  FEHLER: {error}")
+                continue
+            print(f"{size:>8} {variant:<12} {elapsed:>10.2f} {peak_mb:>10.1f} {size_mb:>11.2f}")
+
+
+if __name__ == '__main__':
+    main()
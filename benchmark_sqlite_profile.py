@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: SQLite-Profile (SQLITE_PRAGMA_PROFILES) unter parallelen Review-Edits und Statistik-Abfragen
+
+Fuer jedes Profil:
+1. Temporaere Datenbank mit dem App-Schema und N Posts anlegen
+2. Schreiber-Threads simulieren update_post (ein Post + data_version, ein Commit pro Edit)
+3. Leser-Threads fuehren gleichzeitig die Aggregat-Abfragen von /api/stats und /api/sessions aus
+4. Durchsatz (Edits/s, Reads/s) und "database is locked"-Fehler ausgeben
+
+Aufruf: python benchmark_sqlite_profile.py [--posts 20000] [--seconds 5] [--writers 2] [--readers 4]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine, event, func, select, update
+from sqlalchemy.exc import OperationalError
+
+from app import (
+    db, TwitterPost, AnalysisSession, SQLITE_PRAGMA_PROFILES,
+    apply_sqlite_pragmas, session_counts_query
+)
+
+
+def create_benchmark_engine(path, pragmas):
+    engine = create_engine(f'sqlite:///{path}', connect_args={'check_same_thread': False})
+    event.listen(engine, 'connect', lambda conn, record: apply_sqlite_pragmas(conn, pragmas))
+    return engine
+
+
+def populate(engine, post_count):
+    db.metadata.create_all(engine)
+    rnd = random.Random(42)
+    with engine.begin() as conn:
+        conn.execute(AnalysisSession.__table__.insert(), [{'id': 1, 'name': 'Benchmark', 'is_active': True, 'data_version': 0}])
+        rows = [{
+            'session_id': 1,
+            'twitter_url': f'https://twitter.com/user{i % 500}/status/{i}',
+            'url_key': f'https://twitter.com/user{i % 500}/status/{i}',
+            'twitter_handle': f'user{i % 500}',
+            'likes': rnd.randint(0, 500), 'retweets': rnd.randint(0, 100), 'replies': rnd.randint(0, 50),
+            'bookmarks': rnd.randint(0, 30), 'quotes': rnd.randint(0, 10), 'views': rnd.randint(0, 100000),
+            'twitter_followers': rnd.randint(0, 10 ** 6), 'ter_automatic': rnd.uniform(0, 30),
+            'is_reviewed': rnd.random() < 0.5, 'is_archived': False, 'is_excluded': False, 'is_favorite': False
+        } for i in range(post_count)]
+        conn.execute(TwitterPost.__table__.insert(), rows)
+
+
+def stats_query():
+    """Entspricht dem Kern von /api/stats (Aggregat ueber reviewed Posts der Session)"""
+    ter = func.coalesce(TwitterPost.ter_manual, TwitterPost.ter_automatic)
+    return select(
+        func.count(TwitterPost.id), func.sum(TwitterPost.views), func.min(ter), func.max(ter), func.avg(ter)
+    ).where(TwitterPost.session_id == 1, TwitterPost.is_reviewed == True, TwitterPost.is_archived == False)
+
+
+def run_profile(name, pragmas, args):
+    directory = tempfile.mkdtemp(prefix='ter_bench_')
+    path = os.path.join(directory, 'bench.db')
+    try:
+        engine = create_benchmark_engine(path, pragmas)
+        populate(engine, args.posts)
+
+        counters = {'writes': 0, 'reads': 0, 'locked': 0}
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        def count(key):
+            with lock:
+                counters[key] += 1
+
+        def writer(seed):
+            rnd = random.Random(seed)
+            while not stop.is_set():
+                post_id = rnd.randint(1, args.posts)
+                try:
+                    with engine.begin() as conn:
+                        conn.execute(update(TwitterPost.__table__).where(TwitterPost.id == post_id).values(
+                            ter_manual=round(rnd.uniform(0, 30), 2), is_reviewed=True
+                        ))
+                        conn.execute(update(AnalysisSession.__table__).where(AnalysisSession.id == 1).values(
+                            data_version=AnalysisSession.data_version + 1
+                        ))
+                    count('writes')
+                except OperationalError:
+                    count('locked')
+
+        def reader():
+            while not stop.is_set():
+                try:
+                    with engine.connect() as conn:
+                        conn.execute(stats_query()).one()
+                        conn.execute(session_counts_query([1])).all()
+                    count('reads')
+                except OperationalError:
+                    count('locked')
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(args.writers)]
+        threads += [threading.Thread(target=reader) for _ in range(args.readers)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(args.seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        engine.dispose()
+
+        print(f"{name:<10} {counters['writes'] / elapsed:>10.1f} {counters['reads'] / elapsed:>10.1f} {counters['locked']:>8}")
+        return counters
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--posts', type=int, default=20000)
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--readers', type=int, default=4)
+    args = parser.parse_args()
+
+    print("\n" + "=" * 80)
+    print(f"BENCHMARK: SQLite-Profile ({args.posts} Posts, {args.writers} Schreiber, {args.readers} Leser, {args.seconds}s)")
+    print("=" * 80)
+    print(f"{'Profil':<10} {'Edits/s':>10} {'Reads/s':>10} {'Locked':>8}")
+    for name, pragmas in SQLITE_PRAGMA_PROFILES.items():
+        run_profile(name, pragmas, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,16 @@
-import sqlite3
+from sqlalchemy import inspect
 
-conn = sqlite3.connect('twitter_ter.db')
-cursor = conn.cursor()
-cursor.execute('PRAGMA table_info(twitter_posts)')
-cols = cursor.fetchall()
+from app import app, db
+
+with app.app_context():
+    print(f"Datenbank: {db.engine.url.render_as_string(hide_password=True)}")
+    cols = inspect(db.engine).get_columns('twitter_posts')
 
 print("Columns in twitter_posts table:")
 print("-" * 60)
 for c in cols:
-    print(f"{c[1]:30s} {c[2]:15s} default={c[4]}")
+    print(f"{c['name']:30s} {str(c['type']):15s} default={c.get('default')}")
 
 print("\nSearching for is_excluded column...")
-is_excluded_exists = any('is_excluded' in str(c[1]) for c in cols)
+is_excluded_exists = any(c['name'] == 'is_excluded' for c in cols)
 print(f"is_excluded column exists: {is_excluded_exists}")
-
-conn.close()
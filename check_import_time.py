@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Prueft die Import-Zeit von app.py (Kaltstart in frischen Python-Prozessen)
+
+Dieses Skript:
+1. Importiert app in mehreren frischen Prozessen und misst die Zeit (Median)
+2. Vergleicht den Median mit IMPORT_TIME_BUDGET_MS (Umgebungsvariable TWITTER_TER_IMPORT_BUDGET_MS)
+3. Prueft, dass schwere Bibliotheken (reportlab, openpyxl, numpy, scipy, sklearn) nicht geladen werden
+4. Zeigt die langsamsten Module laut "python -X importtime"
+
+Exit-Code 1, wenn das Budget ueberschritten wird oder schwere Bibliotheken geladen werden.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+RUNS = 5
+HEAVY_MODULES = ['reportlab', 'openpyxl', 'numpy', 'scipy', 'sklearn']
+
+MEASURE_CODE = """
+import sys, time
+started = time.perf_counter()
+import app
+elapsed_ms = (time.perf_counter() - started) * 1000
+heavy = [m for m in %r if m in sys.modules]
+print(f"{elapsed_ms:.1f}|{app.app.config['IMPORT_TIME_BUDGET_MS']}|{','.join(heavy)}")
+""" % (HEAVY_MODULES,)
+
+
+def run_python(args):
+    """Startet einen frischen Python-Prozess im Projektverzeichnis"""
+    env = dict(os.environ)
+    env.pop('TWITTER_TER_STARTUP_TIMING', None)
+    return subprocess.run(
+        [sys.executable] + args,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True
+    )
+
+
+def slowest_imports(limit=10):
+    """Langsamste direkte Imports von app.py (kumulativ) laut -X importtime"""
+    stderr = run_python(['-X', 'importtime', '-c', 'import app']).stderr
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, _, values = line.partition(':')
+        self_us, cumulative_us, name = values.split('|')
+        # Einrueckung = Verschachtelungstiefe; Tiefe 1 = direkt von app importiert
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            entries.append((int(cumulative_us), name.strip()))
+    return sorted(entries, reverse=True)[:limit]
+
+
+def main():
+    print("\n" + "=" * 80)
+    print("IMPORT-ZEIT: app.py")
+    print("=" * 80)
+
+    timings = []
+    heavy = set()
+    budget_ms = None
+    for i in range(RUNS):
+        elapsed, budget, loaded = run_python(['-c', MEASURE_CODE]).stdout.strip().splitlines()[-1].split('|')
+        timings.append(float(elapsed))
+        budget_ms = int(budget)
+        heavy.update(m for m in loaded.split(',') if m)
+        print(f"  Lauf {i + 1}: {float(elapsed):.0f} ms")
+
+    median_ms = statistics.median(timings)
+    print(f"\nMedian: {median_ms:.0f} ms (Budget {budget_ms} ms)")
+
+    print("\nLangsamste direkte Imports von app.py:")
+    for cumulative_us, name in slowest_imports():
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    ok = True
+    if heavy:
+        print(f"\nFEHLER: Schwere Bibliotheken beim Import geladen: {', '.join(sorted(heavy))}")
+        ok = False
+    if median_ms > budget_ms:
+        print(f"\nFEHLER: Import-Zeit ueber Budget ({median_ms:.0f} ms > {budget_ms} ms)")
+        ok = False
+
+    print("\n" + ("OK" if ok else "BUDGET VERLETZT"))
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
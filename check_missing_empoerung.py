@@ -1,23 +1,26 @@
-import sqlite3
 import sys
 import pandas as pd
+from sqlalchemy import text
+
+from app import app, db
 
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
-conn = sqlite3.connect(r'C:\Users\Jason\Desktop\Masterarbeit\Twitter-Auswertung\instance\twitter_ter.db')
-cursor = conn.cursor()
+# Gleiche Datenbank wie die App (DATABASE_URL, Standard: instance/twitter_ter.db)
+app.app_context().push()
+conn = db.engine.connect()
 
 print("=" * 80)
 print("POSTS MIT EMPÖRUNG = 0 (von den 69 wichtigen)")
 print("=" * 80)
 
-cursor.execute('''
+result = conn.execute(text('''
     SELECT id, twitter_url
     FROM twitter_posts
-    WHERE is_reviewed = 1 AND is_excluded = 0 AND trigger_empoerung = 0
-''')
-results = cursor.fetchall()
+    WHERE is_reviewed = TRUE AND is_excluded = FALSE AND trigger_empoerung = 0
+'''))
+results = result.fetchall()
 
 for post_id, url in results:
     print(f'Post ID {post_id}: {url}')
@@ -1,56 +1,51 @@
 # -*- coding: utf-8 -*-
 """
-Check database schema and remove UNIQUE constraint from twitter_url if it exists
+Check database schema for a UNIQUE constraint on twitter_url (SQLite oder PostgreSQL, über DATABASE_URL)
 """
-import sqlite3
-import os
+from sqlalchemy import inspect
 
-db_path = r'c:\Users\Jason\Desktop\Masterarbeit\Twitter-Auswertung\instance\twitter_ter.db'
+from app import app, db
 
-if not os.path.exists(db_path):
-    print(f"Database not found at {db_path}")
-    exit(1)
+with app.app_context():
+    inspector = inspect(db.engine)
 
-conn = sqlite3.connect(db_path)
-cursor = conn.cursor()
+    print("=" * 80)
+    print("DATABASE SCHEMA CHECK")
+    print(f"Datenbank: {db.engine.url.render_as_string(hide_password=True)}")
+    print("=" * 80)
 
-print("=" * 80)
-print("DATABASE SCHEMA CHECK")
-print("=" * 80)
-
-# Get table schema
-cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='twitter_posts'")
-schema = cursor.fetchone()
+    if 'twitter_posts' not in inspector.get_table_names():
+        print("\n❌ twitter_posts table not found")
+        print("=" * 80)
+        raise SystemExit(1)
 
-if schema:
-    print("\nCurrent schema for twitter_posts:")
-    print("-" * 80)
-    print(schema[0])
-    print("-" * 80)
+    indexes = inspector.get_indexes('twitter_posts')
+    unique_constraints = inspector.get_unique_constraints('twitter_posts')
 
-    # Check if UNIQUE constraint exists on twitter_url
-    if 'UNIQUE' in schema[0] and 'twitter_url' in schema[0]:
-        print("\n⚠️  FOUND: UNIQUE constraint on twitter_url column")
+    # UNIQUE auf twitter_url allein (als Constraint oder eindeutiger Index)
+    unique_url = [
+        entry['name'] for entry in unique_constraints + [idx for idx in indexes if idx.get('unique')]
+        if entry['column_names'] == ['twitter_url']
+    ]
+    if unique_url:
+        print(f"\n⚠️  FOUND: UNIQUE constraint on twitter_url column ({', '.join(str(name) for name in unique_url)})")
         print("\nThis constraint needs to be removed to allow the same URL in different sessions.")
     else:
         print("\n✓ No UNIQUE constraint found on twitter_url")
-else:
-    print("\n❌ twitter_posts table not found")
-
-# Get all indexes
-cursor.execute("SELECT name, sql FROM sqlite_master WHERE type='index' AND tbl_name='twitter_posts'")
-indexes = cursor.fetchall()
-
-if indexes:
-    print("\n\nIndexes on twitter_posts:")
-    print("-" * 80)
-    for name, sql in indexes:
-        print(f"Index: {name}")
-        if sql:
-            print(f"SQL: {sql}")
-        print()
-else:
-    print("\nNo indexes found on twitter_posts")
-
-conn.close()
+
+    if unique_constraints:
+        print("\n\nUnique constraints on twitter_posts:")
+        print("-" * 80)
+        for constraint in unique_constraints:
+            print(f"Constraint: {constraint['name']} ({', '.join(constraint['column_names'])})")
+
+    if indexes:
+        print("\n\nIndexes on twitter_posts:")
+        print("-" * 80)
+        for idx in indexes:
+            unique = 'UNIQUE ' if idx.get('unique') else ''
+            print(f"Index: {idx['name']} {unique}({', '.join(str(col) for col in idx['column_names'])})")
+    else:
+        print("\nNo indexes found on twitter_posts")
+
 print("=" * 80)
@@ -1,15 +1,14 @@
-import sqlite3
+from sqlalchemy import inspect
 
-conn = sqlite3.connect('twitter_ter.db')
-cursor = conn.cursor()
-cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-tables = cursor.fetchall()
+from app import app, db
+
+with app.app_context():
+    print(f"Datenbank: {db.engine.url.render_as_string(hide_password=True)}")
+    tables = inspect(db.engine).get_table_names()
 
 print("Tables in database:")
 for table in tables:
-    print(f"  - {table[0]}")
+    print(f"  - {table}")
 
 if not tables:
     print("  No tables found - database needs initialization")
-
-conn.close()
@@ -0,0 +1,24 @@
+"""
+pytest-Konfiguration: Datenbank für die Tests
+
+Die Tests laufen gegen TEST_DATABASE_URL (z.B. ein lokaler PostgreSQL-Container),
+sonst gegen eine temporäre SQLite-Datei. DATABASE_URL muss gesetzt sein, bevor
+app.py importiert wird - die Produktionsdatenbank in instance/ bleibt unberührt.
+Der Export-Cache (EXPORT_DIR) liegt ebenfalls in einem temporären Verzeichnis.
+"""
+import os
+import tempfile
+
+import pytest
+
+os.environ['DATABASE_URL'] = os.environ.get('TEST_DATABASE_URL') or (
+    'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='twitter_ter_test_'), 'twitter_ter.db')
+)
+
+
+@pytest.fixture(scope='session', autouse=True)
+def export_dir(tmp_path_factory):
+    """Export-Cache der Tests außerhalb von instance/exports"""
+    from app import app
+    app.config['EXPORT_DIR'] = str(tmp_path_factory.mktemp('exports'))
+    return app.config['EXPORT_DIR']
@@ -4,25 +4,9 @@ Import trigger and frame justifications from Excel and update database
 import sys
 sys.stdout.reconfigure(encoding='utf-8')
 import pandas as pd
-from app import db, TwitterPost, app
+from app import db, TwitterPost, app, normalize_twitter_url
 from sqlalchemy import text
 
-def normalize_url(url):
-    """Normalize URL for comparison"""
-    if not url:
-        return ""
-    url = url.lower().strip()
-    # Replace x.com with twitter.com
-    url = url.replace('x.com', 'twitter.com')
-    # Remove trailing slashes
-    url = url.rstrip('/')
-    # Remove web.archive.org prefix if present
-    if 'web.archive.org' in url:
-        parts = url.split('https://twitter.com/')
-        if len(parts) > 1:
-            url = 'https://twitter.com/' + parts[-1]
-    return url
-
 def import_justifications():
     """Import justifications from Excel file"""
 
@@ -35,7 +19,8 @@ def import_justifications():
     # Create URL mapping for Excel data
     excel_data = {}
     for _, row in df.iterrows():
-        url = normalize_url(row['Twitter URL'])
+        # Gleiche URL-Normalisierung wie beim Trigger/Frame-Upload im Dashboard
+        url = normalize_twitter_url(row['Twitter URL'])
         if url:
             excel_data[url] = {
                 'angst_justification': row.get('Angst - Detaillierte Begründung', ''),
@@ -63,7 +48,7 @@ def import_justifications():
         not_matched = 0
 
         for post in posts:
-            post_url = normalize_url(post.twitter_url)
+            post_url = normalize_twitter_url(post.twitter_url)
 
             if post_url in excel_data:
                 # Update justifications
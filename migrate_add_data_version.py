@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Migration: data_version Spalte für den Statistik-Cache
+
+Dieses Skript:
+1. Fuegt die Spalte data_version zu analysis_sessions hinzu
+2. Setzt data_version fuer alle bestehenden Sessions auf 0
+"""
+
+from app import app, db
+from sqlalchemy import text
+
+
+def migrate():
+    with app.app_context():
+        print("\n" + "=" * 80)
+        print("MIGRATION: data_version fuer Statistik-Cache")
+        print("=" * 80)
+
+        inspector = db.inspect(db.engine)
+        columns = [col['name'] for col in inspector.get_columns('analysis_sessions')]
+
+        if 'data_version' not in columns:
+            print("\n[1/2] Fuege Spalte data_version hinzu...")
+            db.session.execute(text("ALTER TABLE analysis_sessions ADD COLUMN data_version INTEGER NOT NULL DEFAULT 0"))
+            db.session.commit()
+            print("      OK: data_version Spalte hinzugefuegt.")
+        else:
+            print("\n[1/2] data_version Spalte existiert bereits.")
+
+        print("\n[2/2] Setze fehlende Versionen auf 0...")
+        result = db.session.execute(text("UPDATE analysis_sessions SET data_version = 0 WHERE data_version IS NULL"))
+        db.session.commit()
+        print(f"      OK: {result.rowcount} Sessions aktualisiert.")
+
+        print("\n" + "=" * 80)
+        print("MIGRATION ABGESCHLOSSEN")
+        print("=" * 80)
+
+
+if __name__ == '__main__':
+    migrate()
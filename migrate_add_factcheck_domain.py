@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Migration: factcheck_domain Spalte für Faktenchecker-Liste und -Filter
+
+Dieses Skript:
+1. Fuegt die Spalte factcheck_domain (Domain der factcheck_url ohne www.) zu twitter_posts hinzu
+2. Berechnet factcheck_domain fuer alle bestehenden Posts (extract_factcheck_domain, wie beim Import)
+3. Erstellt den Index ix_twitter_posts_session_factcheck_domain
+4. Erhoeht data_version aller Sessions (Statistik-Cache eines laufenden Servers wird ungueltig)
+
+Kann jederzeit erneut ausgefuehrt werden (z.B. nach direkten Datenbank-Aenderungen).
+"""
+
+from app import app, db, TwitterPost, extract_factcheck_domain
+from sqlalchemy import text
+
+BATCH_SIZE = 1000
+
+
+def migrate():
+    with app.app_context():
+        print("\n" + "=" * 80)
+        print("MIGRATION: factcheck_domain fuer Faktenchecker")
+        print("=" * 80)
+
+        inspector = db.inspect(db.engine)
+        columns = [col['name'] for col in inspector.get_columns('twitter_posts')]
+
+        # 1. Spalte hinzufuegen
+        if 'factcheck_domain' not in columns:
+            print("\n[1/4] Fuege Spalte factcheck_domain hinzu...")
+            column_type = TwitterPost.__table__.c.factcheck_domain.type.compile(dialect=db.engine.dialect)
+            db.session.execute(text(f"ALTER TABLE twitter_posts ADD COLUMN factcheck_domain {column_type}"))
+            db.session.commit()
+            print("      OK: factcheck_domain Spalte hinzugefuegt.")
+        else:
+            print("\n[1/4] factcheck_domain Spalte existiert bereits.")
+
+        # 2. Domains berechnen (updated_at bleibt unveraendert - der Inhalt der Posts aendert sich nicht)
+        print("\n[2/4] Berechne Domains...")
+        rows = db.session.query(TwitterPost.id, TwitterPost.factcheck_url).order_by(TwitterPost.id).all()
+        updates = [{'post_id': post_id, 'domain': extract_factcheck_domain(url)} for post_id, url in rows]
+
+        for start in range(0, len(updates), BATCH_SIZE):
+            db.session.execute(
+                text("UPDATE twitter_posts SET factcheck_domain = :domain WHERE id = :post_id"),
+                updates[start:start + BATCH_SIZE]
+            )
+        db.session.commit()
+        with_domain = sum(1 for update in updates if update['domain'])
+        print(f"      OK: {len(updates)} Posts verarbeitet, {with_domain} mit Faktenchecker-Domain.")
+
+        # 3. Index erstellen
+        print("\n[3/4] Erstelle Index ix_twitter_posts_session_factcheck_domain...")
+        index = next(idx for idx in TwitterPost.__table__.indexes if idx.name == 'ix_twitter_posts_session_factcheck_domain')
+        if index.name not in [idx['name'] for idx in inspector.get_indexes('twitter_posts')]:
+            index.create(bind=db.engine)
+            print("      OK: Index erstellt.")
+        else:
+            print("      Index existiert bereits.")
+
+        # 4. Statistik-Cache invalidieren
+        print("\n[4/4] Erhoehe data_version aller Sessions...")
+        db.session.execute(text("UPDATE analysis_sessions SET data_version = COALESCE(data_version, 0) + 1"))
+        db.session.commit()
+        print("      OK.")
+
+        print("\n" + "=" * 80)
+        print("MIGRATION ABGESCHLOSSEN")
+        print("=" * 80)
+
+
+if __name__ == '__main__':
+    migrate()
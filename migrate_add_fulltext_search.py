@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Migration: FTS5-Volltextindex fuer die Post-Suche (/api/posts/search)
+
+Dieses Skript:
+1. Legt die FTS5-Tabelle twitter_posts_fts und die Sync-Trigger an (falls nicht vorhanden)
+2. Baut den Index aus den bestehenden Posts auf (rebuild)
+
+Nur fuer SQLite. Ohne Index (oder unter PostgreSQL) sucht /api/posts/search per ILIKE.
+"""
+
+from app import app, db, POST_SEARCH_TABLE, post_search_ddl
+from sqlalchemy import text
+
+
+def migrate():
+    with app.app_context():
+        print("\n" + "=" * 80)
+        print("MIGRATION: Volltextsuche (FTS5)")
+        print("=" * 80)
+
+        if db.engine.dialect.name != 'sqlite':
+            print(f"\nDatenbank ist {db.engine.dialect.name} - FTS5 gibt es nur fuer SQLite, Suche nutzt ILIKE.")
+            return
+
+        inspector = db.inspect(db.engine)
+        if 'twitter_posts' not in inspector.get_table_names():
+            print("\nTabelle twitter_posts existiert noch nicht - wird beim Start von app.py angelegt.")
+            return
+
+        print(f"\n[1/2] Lege {POST_SEARCH_TABLE} und Trigger an...")
+        for statement in post_search_ddl():
+            db.session.execute(text(statement))
+        db.session.commit()
+        print("      OK")
+
+        print("\n[2/2] Baue Index aus bestehenden Posts auf...")
+        db.session.execute(text(f"INSERT INTO {POST_SEARCH_TABLE}({POST_SEARCH_TABLE}) VALUES ('rebuild')"))
+        db.session.commit()
+        count = db.session.execute(text("SELECT COUNT(*) FROM twitter_posts")).scalar()
+        print(f"      OK: {count} Posts indiziert.")
+
+        print("\n" + "=" * 80)
+        print("MIGRATION ABGESCHLOSSEN")
+        print("=" * 80)
+
+
+if __name__ == '__main__':
+    migrate()
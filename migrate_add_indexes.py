@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Migration: Indizes fuer twitter_posts und analysis_jobs
+
+Dieses Skript:
+1. Erstellt alle im Model deklarierten Indizes, die in der Datenbank noch fehlen
+2. Aktualisiert die Statistiken des Query-Planers (ANALYZE)
+
+Der eindeutige Index uq_twitter_posts_session_url_key wird von migrate_add_url_key.py angelegt.
+"""
+
+from app import app, db, TwitterPost, AnalysisJob
+from sqlalchemy import text
+
+
+def migrate():
+    with app.app_context():
+        print("\n" + "=" * 80)
+        print("MIGRATION: Indizes")
+        print("=" * 80)
+
+        inspector = db.inspect(db.engine)
+        existing_tables = inspector.get_table_names()
+        created = 0
+
+        for model in (TwitterPost, AnalysisJob):
+            table = model.__table__
+            if table.name not in existing_tables:
+                print(f"\n{table.name}: Tabelle existiert nicht (wird von db.create_all() angelegt), uebersprungen.")
+                continue
+
+            existing = {idx['name'] for idx in inspector.get_indexes(table.name)}
+            print(f"\n{table.name}:")
+            for index in sorted(table.indexes, key=lambda idx: idx.name):
+                if index.unique:
+                    continue
+                if index.name in existing:
+                    print(f"  {index.name} existiert bereits.")
+                    continue
+                index.create(bind=db.engine)
+                created += 1
+                print(f"  OK: {index.name} ({', '.join(col.name for col in index.columns)}) erstellt.")
+
+        # SQLite und PostgreSQL: Planer-Statistiken aktualisieren
+        print("\nAktualisiere Statistiken (ANALYZE)...")
+        with db.engine.begin() as conn:
+            conn.execute(text("ANALYZE"))
+
+        print("\n" + "=" * 80)
+        print(f"MIGRATION ABGESCHLOSSEN: {created} Indizes erstellt")
+        print("=" * 80)
+
+
+if __name__ == '__main__':
+    migrate()
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Migration: Fortschritts-Spalten fuer Hintergrund-Jobs (PDF-Export)
+
+Dieses Skript:
+1. Fuegt die Spalten progress und progress_total zu analysis_jobs hinzu
+"""
+
+from app import app, db, AnalysisJob
+from sqlalchemy import text
+
+
+def migrate():
+    with app.app_context():
+        print("\n" + "=" * 80)
+        print("MIGRATION: Fortschritt fuer Hintergrund-Jobs")
+        print("=" * 80)
+
+        inspector = db.inspect(db.engine)
+        if 'analysis_jobs' not in inspector.get_table_names():
+            print("\nTabelle analysis_jobs existiert noch nicht - wird beim Start von app.py angelegt.")
+            return
+
+        columns = [col['name'] for col in inspector.get_columns('analysis_jobs')]
+        for name in ('progress', 'progress_total'):
+            if name not in columns:
+                print(f"\nFuege Spalte {name} hinzu...")
+                column_type = AnalysisJob.__table__.c[name].type.compile(dialect=db.engine.dialect)
+                db.session.execute(text(f"ALTER TABLE analysis_jobs ADD COLUMN {name} {column_type}"))
+                db.session.commit()
+                print(f"      OK: {name} Spalte hinzugefuegt.")
+            else:
+                print(f"\n{name} Spalte existiert bereits.")
+
+        print("\n" + "=" * 80)
+        print("MIGRATION ABGESCHLOSSEN")
+        print("=" * 80)
+
+
+if __name__ == '__main__':
+    migrate()
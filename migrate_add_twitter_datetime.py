@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Migration: twitter_datetime Spalte für die Zeitreihen-Statistik
+
+Dieses Skript:
+1. Fuegt die Spalte twitter_datetime (geparstes twitter_date) zu twitter_posts hinzu
+2. Parst twitter_date fuer alle bestehenden Posts (parse_twitter_date, wie beim Import)
+3. Erhoeht data_version aller Sessions (Statistik-Cache eines laufenden Servers wird ungueltig)
+
+Kann jederzeit erneut ausgefuehrt werden (z.B. nach direkten Datenbank-Aenderungen).
+"""
+
+from app import app, db, TwitterPost, parse_twitter_date
+from sqlalchemy import text, bindparam
+
+BATCH_SIZE = 1000
+
+
+def migrate():
+    with app.app_context():
+        print("\n" + "=" * 80)
+        print("MIGRATION: twitter_datetime fuer Zeitreihen")
+        print("=" * 80)
+
+        inspector = db.inspect(db.engine)
+        columns = [col['name'] for col in inspector.get_columns('twitter_posts')]
+
+        # 1. Spalte hinzufuegen (Typ passend zum Backend: DATETIME bzw. TIMESTAMP)
+        if 'twitter_datetime' not in columns:
+            print("\n[1/3] Fuege Spalte twitter_datetime hinzu...")
+            column_type = TwitterPost.__table__.c.twitter_datetime.type.compile(dialect=db.engine.dialect)
+            db.session.execute(text(f"ALTER TABLE twitter_posts ADD COLUMN twitter_datetime {column_type}"))
+            db.session.commit()
+            print("      OK: twitter_datetime Spalte hinzugefuegt.")
+        else:
+            print("\n[1/3] twitter_datetime Spalte existiert bereits.")
+
+        # 2. Datum parsen
+        print("\n[2/3] Parse twitter_date...")
+        rows = db.session.query(TwitterPost.id, TwitterPost.twitter_date).order_by(TwitterPost.id).all()
+
+        updates = []
+        unparsed = []
+        for post_id, twitter_date in rows:
+            parsed = parse_twitter_date(twitter_date)
+            if parsed is None and twitter_date and twitter_date.strip():
+                unparsed.append((post_id, twitter_date))
+            updates.append({'post_id': post_id, 'parsed': parsed})
+
+        statement = TwitterPost.__table__.update().where(
+            TwitterPost.__table__.c.id == bindparam('post_id')
+        ).values(twitter_datetime=bindparam('parsed'))
+        for start in range(0, len(updates), BATCH_SIZE):
+            db.session.execute(statement, updates[start:start + BATCH_SIZE])
+        db.session.commit()
+        print(f"      OK: {len(updates)} Posts verarbeitet, {len(updates) - len(unparsed)} mit Datum oder leer.")
+
+        if unparsed:
+            print(f"      WARNUNG: {len(unparsed)} Datumswerte nicht erkannt (fehlen in der Zeitreihe):")
+            for post_id, twitter_date in unparsed[:20]:
+                print(f"        Post {post_id}: {twitter_date!r}")
+
+        # 3. Statistik-Cache invalidieren
+        print("\n[3/3] Erhoehe data_version aller Sessions...")
+        db.session.execute(text("UPDATE analysis_sessions SET data_version = COALESCE(data_version, 0) + 1"))
+        db.session.commit()
+        print("      OK.")
+
+        print("\n" + "=" * 80)
+        print("MIGRATION ABGESCHLOSSEN")
+        print("=" * 80)
+
+
+if __name__ == '__main__':
+    migrate()
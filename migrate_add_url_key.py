@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Migration: url_key Spalte für den Upsert-Import
+
+Dieses Skript:
+1. Fuegt die Spalte url_key (normalisierte twitter_url) zu twitter_posts hinzu
+2. Fuellt url_key fuer alle bestehenden Posts
+3. Markiert doppelte URLs innerhalb einer Session (nur der aelteste Post behaelt den Schluessel)
+4. Erstellt den eindeutigen Index (session_id, url_key)
+"""
+
+from app import app, db, TwitterPost, normalize_twitter_url
+from sqlalchemy import text
+
+
+def migrate():
+    with app.app_context():
+        print("\n" + "=" * 80)
+        print("MIGRATION: url_key fuer Upsert-Import")
+        print("=" * 80)
+
+        inspector = db.inspect(db.engine)
+        columns = [col['name'] for col in inspector.get_columns('twitter_posts')]
+
+        # 1. Spalte hinzufuegen
+        if 'url_key' not in columns:
+            print("\n[1/4] Fuege Spalte url_key hinzu...")
+            db.session.execute(text("ALTER TABLE twitter_posts ADD COLUMN url_key VARCHAR(500)"))
+            db.session.commit()
+            print("      OK: url_key Spalte hinzugefuegt.")
+        else:
+            print("\n[1/4] url_key Spalte existiert bereits.")
+
+        # 2. + 3. Schluessel berechnen, Duplikate pro Session erkennen
+        print("\n[2/4] Berechne normalisierte URLs...")
+        rows = db.session.query(TwitterPost.id, TwitterPost.session_id, TwitterPost.twitter_url).order_by(TwitterPost.id).all()
+
+        seen = set()
+        updates = []
+        duplicates = []
+        for post_id, session_id, twitter_url in rows:
+            key = normalize_twitter_url(twitter_url) or None
+            if key and (session_id, key) in seen:
+                duplicates.append((post_id, session_id, twitter_url))
+                key = None
+            elif key:
+                seen.add((session_id, key))
+            updates.append({'post_id': post_id, 'url_key': key})
+
+        print(f"\n[3/4] Schreibe url_key fuer {len(updates)} Posts...")
+        if updates:
+            db.session.execute(
+                text("UPDATE twitter_posts SET url_key = :url_key WHERE id = :post_id"),
+                updates
+            )
+        db.session.commit()
+
+        if duplicates:
+            print(f"      WARNUNG: {len(duplicates)} doppelte URLs gefunden (url_key bleibt leer, Upsert ignoriert diese Posts):")
+            for post_id, session_id, twitter_url in duplicates[:20]:
+                print(f"        Post {post_id} (Session {session_id}): {twitter_url}")
+
+        # 4. Eindeutigen Index erstellen
+        print("\n[4/4] Erstelle Index uq_twitter_posts_session_url_key...")
+        indexes = [idx['name'] for idx in inspector.get_indexes('twitter_posts')]
+        if 'uq_twitter_posts_session_url_key' not in indexes:
+            db.session.execute(text(
+                "CREATE UNIQUE INDEX uq_twitter_posts_session_url_key ON twitter_posts (session_id, url_key)"
+            ))
+            db.session.commit()
+            print("      OK: Index erstellt.")
+        else:
+            print("      Index existiert bereits.")
+
+        print("\n" + "=" * 80)
+        print("MIGRATION ABGESCHLOSSEN")
+        print("=" * 80)
+
+
+if __name__ == '__main__':
+    migrate()
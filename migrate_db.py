@@ -12,7 +12,7 @@ Dieses Skript:
 
 from app import app, db, AnalysisSession, TwitterPost
 from datetime import datetime
-import sqlite3
+from sqlalchemy import text
 
 def migrate():
     with app.app_context():
@@ -37,40 +37,29 @@ def migrate():
             # is_favorite Spalte hinzufügen falls nicht vorhanden
             if 'is_favorite' not in columns:
                 print("\nINFO: is_favorite Spalte fehlt - wird hinzugefuegt...")
-                conn = sqlite3.connect('instance/twitter_ter.db')
-                cursor = conn.cursor()
                 try:
-                    cursor.execute("ALTER TABLE twitter_posts ADD COLUMN is_favorite INTEGER DEFAULT 0")
-                    conn.commit()
+                    db.session.execute(text("ALTER TABLE twitter_posts ADD COLUMN is_favorite BOOLEAN DEFAULT FALSE"))
+                    db.session.commit()
                     print("      OK: is_favorite Spalte hinzugefuegt.")
                 except Exception as e:
                     print(f"      FEHLER: {str(e)}")
-                    conn.rollback()
-                finally:
-                    conn.close()
+                    db.session.rollback()
 
             # access_date Spalte hinzufügen falls nicht vorhanden
             if 'access_date' not in columns:
                 print("\nINFO: access_date Spalte fehlt - wird hinzugefuegt...")
-                conn = sqlite3.connect('instance/twitter_ter.db')
-                cursor = conn.cursor()
                 try:
-                    cursor.execute("ALTER TABLE twitter_posts ADD COLUMN access_date TEXT")
-                    conn.commit()
+                    db.session.execute(text("ALTER TABLE twitter_posts ADD COLUMN access_date TEXT"))
+                    db.session.commit()
                     print("      OK: access_date Spalte hinzugefuegt.")
                 except Exception as e:
                     print(f"      FEHLER: {str(e)}")
-                    conn.rollback()
-                finally:
-                    conn.close()
+                    db.session.rollback()
 
             if 'session_id' not in columns:
                 print("\nWARNING: session_id Spalte fehlt in twitter_posts - wird jetzt hinzugefuegt.")
 
-                # Session-ID Spalte hinzufuegen mit SQLite
-                conn = sqlite3.connect('instance/twitter_ter.db')
-                cursor = conn.cursor()
-
+                # Session-ID Spalte hinzufuegen (gleiche Datenbank wie die App)
                 try:
                     # Standard-Session erstellen falls noch keine existiert
                     if session_count == 0:
@@ -93,22 +82,23 @@ def migrate():
                         print(f"      Nutze existierende Session '{default_session.name}' (ID: {default_session_id})")
 
                     # Spalte hinzufuegen
-                    cursor.execute(f"ALTER TABLE twitter_posts ADD COLUMN session_id INTEGER DEFAULT {default_session_id}")
-                    conn.commit()
+                    db.session.execute(text(f"ALTER TABLE twitter_posts ADD COLUMN session_id INTEGER DEFAULT {int(default_session_id)}"))
+                    db.session.commit()
                     print("      OK: session_id Spalte hinzugefuegt.")
 
                     # Alle Posts mit NULL session_id aktualisieren
-                    cursor.execute(f"UPDATE twitter_posts SET session_id = {default_session_id} WHERE session_id IS NULL")
-                    conn.commit()
-                    updated_count = cursor.rowcount
+                    result = db.session.execute(
+                        text("UPDATE twitter_posts SET session_id = :session_id WHERE session_id IS NULL"),
+                        {'session_id': default_session_id}
+                    )
+                    db.session.commit()
+                    updated_count = result.rowcount
                     print(f"      OK: {updated_count} Posts der Session zugewiesen.")
 
                 except Exception as e:
                     print(f"      FEHLER: {str(e)}")
-                    conn.rollback()
+                    db.session.rollback()
                     return
-                finally:
-                    conn.close()
 
                 print("\nMigration erfolgreich abgeschlossen!")
                 return
@@ -128,19 +118,13 @@ def migrate():
 
         # Schritt 1: Alte Posts sichern
         print("[1/5] Bestehende Posts werden gesichert...")
-        conn = sqlite3.connect('instance/twitter_ter.db')
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute("SELECT COUNT(*) FROM twitter_posts")
-            old_post_count = cursor.fetchone()[0]
+        if 'twitter_posts' in tables:
+            old_post_count = db.session.execute(text("SELECT COUNT(*) FROM twitter_posts")).scalar()
             print(f"      {old_post_count} Posts gefunden.")
-        except:
+        else:
             old_post_count = 0
             print("      Keine Posts gefunden (neue Installation).")
 
-        conn.close()
-
         # Schritt 2: Neue Tabellen erstellen
         print("\n[2/5] Neue Tabellen werden erstellt...")
         db.create_all()
@@ -4,56 +4,60 @@ Nur für Posts mit manuellen Metriken (likes_manual, retweets_manual, etc.)
 """
 
 from app import app, db, TwitterPost, TERCalculator
-import math
+from sqlalchemy import update, bindparam, func, text
 
 def recalculate_manual_ter():
-    """Berechnet alle manuellen TER-Werte neu"""
+    """Berechnet alle manuellen TER-Werte neu (vektorisiert)"""
 
     with app.app_context():
         # Alle Posts mit ter_manual Werten
-        posts = TwitterPost.query.filter(TwitterPost.ter_manual.isnot(None)).all()
-
-        print(f"Starte Neuberechnung fuer {len(posts)} Posts mit manuellen TER-Werten...")
-        updated_count = 0
-
-        for post in posts:
-            try:
-                # Manuelle Werte verwenden, falls vorhanden, sonst automatische
-                likes = post.likes_manual if post.likes_manual is not None else post.likes
-                bookmarks = post.bookmarks_manual if post.bookmarks_manual is not None else post.bookmarks
-                replies = post.replies_manual if post.replies_manual is not None else post.replies
-                retweets = post.retweets_manual if post.retweets_manual is not None else post.retweets
-                quotes = post.quotes_manual if post.quotes_manual is not None else post.quotes
-                views = post.views_manual if post.views_manual is not None else post.views
-
-                # TER mit korrigierter Gewichtung neu berechnen
-                ter_result = TERCalculator.calculate(
-                    likes=likes,
-                    bookmarks=bookmarks,
-                    replies=replies,
-                    retweets=retweets,
-                    quotes=quotes,
-                    views=views
-                )
-
-                # Nur ter_manual aktualisieren
-                post.ter_manual = ter_result['ter_sqrt']
-
-                updated_count += 1
-
-                if updated_count <= 5 or updated_count % 20 == 0:
-                    print(f"  Post ID {post.id}: ter_manual = {post.ter_manual:.2f}")
-                    print(f"    Metriken: L={likes}, B={bookmarks}, Rep={replies}, Ret={retweets}, Q={quotes}, V={views}")
-                    print(f"    Weighted Engagement: {ter_result['weighted_engagement']}")
-
-            except Exception as e:
-                print(f"Fehler bei Post ID {post.id}: {str(e)}")
-                continue
+        # Manuelle Werte verwenden, falls vorhanden, sonst automatische
+        rows = db.session.query(
+            TwitterPost.id,
+            func.coalesce(TwitterPost.likes_manual, TwitterPost.likes, 0),
+            func.coalesce(TwitterPost.bookmarks_manual, TwitterPost.bookmarks, 0),
+            func.coalesce(TwitterPost.replies_manual, TwitterPost.replies, 0),
+            func.coalesce(TwitterPost.retweets_manual, TwitterPost.retweets, 0),
+            func.coalesce(TwitterPost.quotes_manual, TwitterPost.quotes, 0),
+            func.coalesce(TwitterPost.views_manual, TwitterPost.views, 0)
+        ).filter(TwitterPost.ter_manual.isnot(None)).all()
+
+        print(f"Starte Neuberechnung fuer {len(rows)} Posts mit manuellen TER-Werten...")
+
+        if rows:
+            post_ids, likes, bookmarks, replies, retweets, quotes, views = zip(*rows)
+
+            # TER mit korrigierter Gewichtung für alle Posts auf einmal berechnen
+            ter_result = TERCalculator.calculate_batch(
+                likes=likes,
+                bookmarks=bookmarks,
+                replies=replies,
+                retweets=retweets,
+                quotes=quotes,
+                views=views
+            )
+            ter_values = ter_result['ter_sqrt'].tolist()
+
+            for idx in range(len(post_ids)):
+                if idx < 5 or (idx + 1) % 20 == 0:
+                    print(f"  Post ID {post_ids[idx]}: ter_manual = {ter_values[idx]:.2f}")
+                    print(f"    Metriken: L={likes[idx]}, B={bookmarks[idx]}, Rep={replies[idx]}, Ret={retweets[idx]}, Q={quotes[idx]}, V={views[idx]}")
+                    print(f"    Weighted Engagement: {int(ter_result['weighted_engagement'][idx])}")
+
+            # Nur ter_manual aktualisieren (ein executemany-UPDATE)
+            table = TwitterPost.__table__
+            db.session.execute(
+                update(table).where(table.c.id == bindparam('b_id')).values(ter_manual=bindparam('b_ter_manual')),
+                [{'b_id': post_id, 'b_ter_manual': ter} for post_id, ter in zip(post_ids, ter_values)]
+            )
+
+        # data_version aller Sessions erhöhen (Statistik-Cache eines laufenden Servers wird ungültig)
+        db.session.execute(text("UPDATE analysis_sessions SET data_version = COALESCE(data_version, 0) + 1"))
 
         # Alle Änderungen speichern
         db.session.commit()
 
-        print(f"\nErfolgreich {updated_count} von {len(posts)} Posts mit manuellen TER-Werten aktualisiert!")
+        print(f"\nErfolgreich {len(rows)} von {len(rows)} Posts mit manuellen TER-Werten aktualisiert!")
 
 if __name__ == '__main__':
     recalculate_manual_ter()
@@ -4,51 +4,75 @@ Retweets ×3, Replies ×4 (vorher falsch: Replies ×3, Retweets ×4)
 """
 
 from app import app, db, TwitterPost, TERCalculator
-import math
+from sqlalchemy import update, bindparam, text
 
 def recalculate_all_ter():
-    """Berechnet alle TER-Werte in der Datenbank neu"""
+    """Berechnet alle TER-Werte in der Datenbank neu (vektorisiert)"""
 
     with app.app_context():
-        # Alle Posts abrufen
-        posts = TwitterPost.query.all()
+        # Nur die benötigten Spalten laden
+        rows = db.session.query(
+            TwitterPost.id, TwitterPost.likes, TwitterPost.bookmarks, TwitterPost.replies,
+            TwitterPost.retweets, TwitterPost.quotes, TwitterPost.views
+        ).all()
 
-        print(f"Starte Neuberechnung für {len(posts)} Posts...")
-        updated_count = 0
+        print(f"Starte Neuberechnung für {len(rows)} Posts...")
 
-        for post in posts:
-            try:
-                # TER mit korrigierter Gewichtung neu berechnen
-                ter_result = TERCalculator.calculate(
-                    likes=post.likes,
-                    bookmarks=post.bookmarks,
-                    replies=post.replies,
-                    retweets=post.retweets,
-                    quotes=post.quotes,
-                    views=post.views
-                )
+        if rows:
+            post_ids, likes, bookmarks, replies, retweets, quotes, views = zip(*rows)
 
-                # Werte aktualisieren
-                post.ter_automatic = ter_result['ter_sqrt']
-                post.ter_linear = ter_result['ter_linear']
-                post.weighted_engagement = ter_result['weighted_engagement']
-                post.total_interactions = ter_result['total_interactions']
-                post.engagement_level = ter_result['engagement_level']
-                post.engagement_level_code = ter_result['engagement_level_code']
+            # TER mit korrigierter Gewichtung für alle Posts auf einmal berechnen
+            ter_result = TERCalculator.calculate_batch(
+                likes=[value or 0 for value in likes],
+                bookmarks=[value or 0 for value in bookmarks],
+                replies=[value or 0 for value in replies],
+                retweets=[value or 0 for value in retweets],
+                quotes=[value or 0 for value in quotes],
+                views=[value or 0 for value in views]
+            )
 
-                updated_count += 1
+            # Werte als ein executemany-UPDATE schreiben
+            params = [
+                {
+                    'b_id': post_id,
+                    'b_ter_automatic': ter_sqrt,
+                    'b_ter_linear': ter_linear,
+                    'b_weighted_engagement': weighted_engagement,
+                    'b_total_interactions': total_interactions,
+                    'b_engagement_level': engagement_level,
+                    'b_engagement_level_code': engagement_level_code
+                }
+                for post_id, ter_sqrt, ter_linear, weighted_engagement, total_interactions, engagement_level, engagement_level_code in zip(
+                    post_ids,
+                    ter_result['ter_sqrt'].tolist(),
+                    ter_result['ter_linear'].tolist(),
+                    ter_result['weighted_engagement'].tolist(),
+                    ter_result['total_interactions'].tolist(),
+                    ter_result['engagement_level'].tolist(),
+                    ter_result['engagement_level_code'].tolist()
+                )
+            ]
 
-                if updated_count % 100 == 0:
-                    print(f"  {updated_count} Posts aktualisiert...")
+            table = TwitterPost.__table__
+            db.session.execute(
+                update(table).where(table.c.id == bindparam('b_id')).values(
+                    ter_automatic=bindparam('b_ter_automatic'),
+                    ter_linear=bindparam('b_ter_linear'),
+                    weighted_engagement=bindparam('b_weighted_engagement'),
+                    total_interactions=bindparam('b_total_interactions'),
+                    engagement_level=bindparam('b_engagement_level'),
+                    engagement_level_code=bindparam('b_engagement_level_code')
+                ),
+                params
+            )
 
-            except Exception as e:
-                print(f"Fehler bei Post ID {post.id}: {str(e)}")
-                continue
+        # data_version aller Sessions erhöhen (Statistik-Cache eines laufenden Servers wird ungültig)
+        db.session.execute(text("UPDATE analysis_sessions SET data_version = COALESCE(data_version, 0) + 1"))
 
         # Alle Änderungen speichern
         db.session.commit()
 
-        print(f"\nErfolgreich {updated_count} von {len(posts)} Posts aktualisiert!")
+        print(f"\nErfolgreich {len(rows)} von {len(rows)} Posts aktualisiert!")
         print("\nBeispiel-Vergleich (erste 5 Posts):")
         print("-" * 80)
 
@@ -6,6 +6,8 @@ from openpyxl import load_workbook
 from datetime import datetime
 import shutil
 
+from app import normalize_twitter_url, extract_factcheck_domain
+
 def restore_from_excel():
     excel_file = r'C:\Users\Jason\Desktop\Masterarbeit\CSV Tabellen\reviewed_posts_export_2025-11-12.xlsx'
     current_db = 'instance/twitter_ter.db'
@@ -156,7 +158,9 @@ def restore_from_excel():
             if existing:
                 cursor.execute('''
                     UPDATE twitter_posts SET
+                        url_key = ?,
                         factcheck_url = ?,
+                        factcheck_domain = ?,
                         factcheck_title = ?,
                         factcheck_date = ?,
                         factcheck_rating = ?,
@@ -179,7 +183,9 @@ def restore_from_excel():
                         updated_at = ?
                     WHERE id = ?
                 ''', (
+                    normalize_twitter_url(twitter_url),
                     details.get('factcheck_url', ''),
+                    extract_factcheck_domain(details.get('factcheck_url', '')),
                     details.get('factcheck_title', ''),
                     details.get('factcheck_date', ''),
                     details.get('factcheck_rating', ''),
@@ -205,21 +211,23 @@ def restore_from_excel():
             else:
                 cursor.execute('''
                     INSERT INTO twitter_posts (
-                        session_id, factcheck_url, factcheck_title, factcheck_date, factcheck_rating,
-                        twitter_url, twitter_author, twitter_handle, twitter_followers,
+                        session_id, factcheck_url, factcheck_domain, factcheck_title, factcheck_date, factcheck_rating,
+                        twitter_url, url_key, twitter_author, twitter_handle, twitter_followers,
                         twitter_content, twitter_date, access_date,
                         likes, retweets, replies, bookmarks, quotes, views,
                         ter_automatic, ter_linear, ter_manual,
                         is_reviewed, is_archived, is_excluded, is_favorite,
                         created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''', (
                     session_id,
                     details.get('factcheck_url', ''),
+                    extract_factcheck_domain(details.get('factcheck_url', '')),
                     details.get('factcheck_title', ''),
                     details.get('factcheck_date', ''),
                     details.get('factcheck_rating', ''),
                     twitter_url,
+                    normalize_twitter_url(twitter_url),
                     autor,
                     handle,
                     follower,
@@ -0,0 +1,96 @@
+"""
+Test: Diagramm-Daten der erweiterten Analyse (compute_chart_data) aus den Gruppen-Aggregaten
+stimmen mit der direkten Berechnung über Masken pro Gruppe überein
+"""
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from app import chart_group_aggregates, compute_chart_data
+
+TRIGGER_NAMES = ['Angst', 'Wut', 'Empörung', 'Ekel', 'Identitätsbezug', 'Hoffnung/Stolz']
+FRAME_NAMES = ['Opfer-Täter Frame', 'Bedrohungs-Frame', 'Verschwörungs-Frame', 'Moral-Frame', 'Historischer Frame']
+
+
+def sample_data(seed, n=300):
+    rng = np.random.default_rng(seed)
+    triggers = {name: rng.integers(0, 6, n) * (rng.random(n) < 0.6) for name in TRIGGER_NAMES}
+    frames = {name: (rng.random(n) < 0.35).astype(int) for name in FRAME_NAMES}
+    ter = np.round(rng.gamma(1.5, 3.0, n), 2)
+    return ter, triggers, frames
+
+
+def by(series, key):
+    return {entry[key]: entry for entry in series}
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_series_match_masks(seed):
+    ter, triggers, frames = sample_data(seed)
+    charts = compute_chart_data(ter, triggers, frames)
+    n = len(ter)
+
+    for name, values in triggers.items():
+        has = values > 0
+        entry = by(charts['trigger_ter'], 'trigger')[name]
+        assert entry['count_with'] == has.sum() and entry['count_without'] == n - has.sum()
+        assert entry['avg_ter_with'] == pytest.approx(ter[has].mean(), abs=0.006)
+        assert entry['avg_ter_without'] == pytest.approx(ter[~has].mean(), abs=0.006)
+        assert by(charts['trigger_frequency'], 'trigger')[name]['count'] == has.sum()
+        assert by(charts['trigger_hexagon'], 'trigger')[name]['frequency'] == round(has.mean() * 100, 1)
+
+        high = values >= 3
+        combination = next(c for c in charts['trigger_frame_combinations']
+                           if c['trigger'] == name and c['intensity'] == 'Hoch (3+)')
+        assert combination['count'] == high.sum()
+        for frame_name, frame_values in frames.items():
+            assert combination['frame_usage'][frame_name] == pytest.approx(frame_values[high].mean() * 100, abs=0.06)
+
+    for name, values in frames.items():
+        has = values == 1
+        entry = by(charts['frame_ter'], 'frame')[name]
+        assert entry['avg_ter_with'] == pytest.approx(ter[has].mean(), abs=0.006)
+        assert entry['avg_ter_without'] == pytest.approx(ter[~has].mean(), abs=0.006)
+
+    top = charts['top_combinations']
+    assert len(top) == 10 and [c['avg_ter'] for c in top] == sorted((c['avg_ter'] for c in top), reverse=True)
+    for entry in top:
+        both = (triggers[entry['trigger']] >= 3) & (frames[entry['frame']] == 1)
+        assert entry['count'] == both.sum()
+        assert entry['avg_ter'] == pytest.approx(ter[both].mean(), abs=0.006)
+
+    pair_counts = sorted(
+        (int(((frames[a] == 1) & (frames[b] == 1)).sum()) for a, b in combinations(FRAME_NAMES, 2)), reverse=True
+    )
+    assert [c['count'] for c in charts['frame_combinations']] == pair_counts[:5]
+    for entry in charts['frame_combinations']:
+        both = (frames[entry['frame1']] == 1) & (frames[entry['frame2']] == 1)
+        assert entry['avg_ter'] == pytest.approx(ter[both].mean(), abs=0.006)
+        assert entry['avg_ter_without'] == pytest.approx(ter[~both].mean(), abs=0.006)
+
+
+def test_aggregates_are_group_and_pair_counts():
+    ter, triggers, frames = sample_data(5, n=50)
+    aggregates = chart_group_aggregates(ter, triggers, frames)
+    index = aggregates['index']
+    assert aggregates['counts'].shape == (len(TRIGGER_NAMES) * 3 + len(FRAME_NAMES) * 2,) * 2
+
+    low, frame = index[('low', 'Wut')], index[('frame', 'Moral-Frame')]
+    both = (triggers['Wut'] <= 1) & (frames['Moral-Frame'] == 1)
+    assert aggregates['counts'][low, frame] == both.sum()
+    assert aggregates['sums'][low, frame] == pytest.approx(ter[both].sum())
+
+
+def test_degenerate_groups():
+    """Trigger bei allen Posts: keine Vergleichsgruppe -> NaN wie bisher (wird zu null im JSON)"""
+    ter, triggers, frames = sample_data(7, n=20)
+    triggers['Angst'][:] = 4
+    frames['Historischer Frame'][:3] = 2  # Rohwerte != 1 zählen beim Frame-Anteil mit ihrem Wert
+    charts = compute_chart_data(ter, triggers, frames)
+
+    angst = by(charts['trigger_ter'], 'trigger')['Angst']
+    assert angst['count_without'] == 0 and np.isnan(angst['avg_ter_without'])
+    low = [c for c in charts['trigger_frame_combinations'] if c['trigger'] == 'Angst']
+    assert [c['intensity'] for c in low] == ['Hoch (3+)']
+    assert low[0]['frame_usage']['Historischer Frame'] == pytest.approx(frames['Historischer Frame'].mean() * 100, abs=0.06)
@@ -0,0 +1,203 @@
+"""
+Test: Import, Post-Listen, Statistiken und Session-Zähler liefern auf jedem Backend dasselbe
+
+Läuft gegen die Datenbank aus conftest.py (SQLite oder TEST_DATABASE_URL, z.B. PostgreSQL).
+"""
+import csv
+import io
+
+import pytest
+
+from app import app, db, TwitterPost
+
+CSV_HEADER = ('factcheck_url,factcheck_title,factcheck_date,factcheck_rating,twitter_url,twitter_author,'
+              'twitter_handle,twitter_followers,twitter_content,twitter_date,likes,retweets,replies,bookmarks,quotes,views\n')
+
+
+def make_csv(count, likes_offset=0):
+    rows = [
+        f'https://correctiv.org/fc/{i},Titel {i},2023-01-01,falsch,https://twitter.com/user{i % 3}/status/{1000 + i},'
+        f'Autor {i},user{i % 3},{100 * i},"Inhalt, {i}",2023-0{1 + i % 9}-15,{i % 7 + likes_offset},{i % 5},{i % 4},{i % 3},{i % 2},{1000 + 37 * i}\n'
+        for i in range(count)
+    ]
+    return CSV_HEADER + ''.join(rows)
+
+
+@pytest.fixture(scope='module')
+def client():
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    client = app.test_client()
+    response = client.post('/api/sessions', json={'name': 'Backend-Test'})
+    client.post(f"/api/sessions/{response.get_json()['session']['id']}/activate")
+    yield client
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+def upload(client, text, mode):
+    data = {'file': (io.BytesIO(text.encode('utf-8')), 'posts.csv'), 'mode': mode}
+    response = client.post('/api/upload', data=data, content_type='multipart/form-data')
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+
+def fetch_all_pages(client, sort, order, limit=4):
+    ids, cursor = [], None
+    while True:
+        params = {'sort': sort, 'order': order, 'limit': limit}
+        if cursor:
+            params['cursor'] = cursor
+        page = client.get('/api/posts', query_string=params).get_json()
+        ids += [post['id'] for post in page['posts']]
+        cursor = page['next_cursor']
+        if not page['has_more']:
+            return ids
+
+
+def test_engine_options():
+    """Connection-Pool nur für Server-Datenbanken"""
+    with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            assert 'SQLALCHEMY_ENGINE_OPTIONS' not in app.config or not app.config['SQLALCHEMY_ENGINE_OPTIONS']
+        else:
+            assert db.engine.pool.size() == app.config['SQLALCHEMY_ENGINE_OPTIONS']['pool_size']
+            assert db.engine.pool._pre_ping == app.config['SQLALCHEMY_ENGINE_OPTIONS']['pool_pre_ping']
+
+
+def test_import_replace_and_upsert(client):
+    result = upload(client, make_csv(20), 'replace')
+    assert result['inserted'] == 20
+
+    # Gleiche Datei: nichts geändert; 5 Posts mehr und neue Likes: alle aktualisiert
+    assert upload(client, make_csv(20), 'upsert')['unchanged'] == 20
+    result = upload(client, make_csv(25, likes_offset=1), 'upsert')
+    assert (result['inserted'], result['updated'], result['unchanged']) == (5, 20, 0)
+
+
+def test_pagination_matches_full_list(client):
+    posts = client.get('/api/posts').get_json()['posts']
+    # Einige manuelle TER-Werte (mit Gleichständen), der Rest bleibt NULL
+    for index, post in enumerate(posts[:12]):
+        response = client.put(f"/api/posts/{post['id']}", json={'ter_manual': float(index % 4), 'is_reviewed': True})
+        assert response.status_code == 200
+
+    for sort in ('created_at', 'ter_automatic', 'ter_manual', 'views', 'followers'):
+        for order in ('asc', 'desc'):
+            full = client.get('/api/posts', query_string={'sort': sort, 'order': order}).get_json()['posts']
+            assert fetch_all_pages(client, sort, order) == [post['id'] for post in full], (sort, order)
+
+
+def test_statistics_and_session_counts(client):
+    stats = client.get('/api/stats').get_json()
+    assert stats['total_posts'] == 25
+    assert stats['reviewed_posts'] == 12
+    assert stats['unreviewed_posts'] == 13
+    assert stats['ter_manual']['count'] == 12
+    assert stats['ter_manual']['sum'] == sum(float(i % 4) for i in range(12))
+    assert sum(stats['ter_interpretation_distribution'].values()) == 12
+
+    sessions = client.get('/api/sessions').get_json()['sessions']
+    assert [(s['post_count'], s['reviewed_count'], s['archived_count']) for s in sessions] == [(25, 12, 0)]
+
+
+def test_timeline_groups_by_month(client):
+    """GROUP BY über twitter_datetime (strftime bzw. to_char) - gleiche Perioden wie twitter_date"""
+    posts = [p for p in client.get('/api/posts').get_json()['posts'] if p['is_reviewed']]
+    expected = {}
+    for post in posts:
+        month = expected.setdefault(post['twitter_date'][:7], [])
+        month.append(post['ter_manual'])
+
+    timeline = client.get('/api/stats/timeline').get_json()
+    assert [m['period'] for m in timeline['monthly']] == sorted(expected)
+    for month in timeline['monthly']:
+        values = expected[month['period']]
+        assert month['post_count'] == len(values)
+        assert month['avg_ter'] == round(sum(values) / len(values), 2)
+    assert [(y['period'], y['post_count']) for y in timeline['yearly']] == [('2023', len(posts))]
+
+
+def test_reviewed_csv_export_streams(client, monkeypatch):
+    """Gestreamter CSV-Export (yield_per) - Chunks zu je EXPORT_STREAM_BATCH_SIZE Posts"""
+    monkeypatch.setitem(app.config, 'EXPORT_STREAM_BATCH_SIZE', 5)
+    response = client.get('/api/posts/reviewed/export-csv')
+    assert response.status_code == 200
+    assert response.is_streamed
+
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    reviewed = {p['twitter_url']: p for p in client.get('/api/posts').get_json()['posts'] if p['is_reviewed']}
+    assert len(rows) == len(reviewed)
+    for row in rows:
+        post = reviewed[row['twitter_url']]
+        assert row['likes'] == str(post['likes'])
+        assert row['access_date'] == (post['access_date'] or '')
+
+
+def test_url_key_default_and_duplicate_urls(client, monkeypatch):
+    session_id = client.post('/api/sessions', json={'name': 'URL-Schlüssel'}).get_json()['session']['id']
+    client.post(f'/api/sessions/{session_id}/activate')
+
+    # Ohne CSV-Import angelegter Post (ORM) bekommt seinen url_key aus twitter_url
+    with app.app_context():
+        post = TwitterPost(session_id=session_id, twitter_url='https://x.com/User1/status/1001?s=20')
+        db.session.add(post)
+        db.session.commit()
+        assert post.url_key == 'https://twitter.com/user1/status/1001'
+
+    result = upload(client, make_csv(3), 'upsert')
+    assert (result['inserted'], result['updated'] + result['unchanged']) == (2, 1)
+
+    # Doppelte URLs in einer CSV - auch über Batch-Grenzen - werden zusammengeführt und gezählt
+    monkeypatch.setitem(app.config, 'IMPORT_BATCH_SIZE', 4)
+    # Zeile 2 ist Post 1000 mit anderem Titel und mehr Likes (im selben Batch), Zeile 9/10 wiederholen Posts
+    # aus früheren Batches: wie beim Upsert zählen nur die Engagement-Werte der späteren Zeilen
+    lines = make_csv(8).splitlines(keepends=True)
+    changed = lines[1].replace(',Titel 0,', ',Titel doppelt,').replace('"Inhalt, 0",2023-01-15,0,', '"Inhalt, 0",2023-01-15,42,')
+    duplicated = ''.join(lines[:2] + [changed] + lines[2:] + [lines[2], lines[8]])
+    result = upload(client, duplicated, 'replace')
+    assert (result['inserted'], result['duplicates'], result['total']) == (8, 3, 8)
+    assert 'doppelte URLs' in result['message']
+
+    posts = client.get('/api/posts', query_string={'fields': 'full'}).get_json()['posts']
+    assert len(posts) == 8
+    first = next(p for p in posts if p['twitter_url'].endswith('/1000'))
+    assert (first['factcheck_title'], first['likes']) == ('Titel 0', 42)
+
+
+def test_trigger_frame_import_matches_url_key(client):
+    """Trigger/Frame-Import findet Posts über url_key (x.com, Query-Parameter, web.archive.org)"""
+    text = ('Twitter URL\tAngst Score\tMoral-Frame\n'
+            'https://x.com/USER1/status/1001?s=20\t4\t1\n'
+            'https://web.archive.org/web/2023/https://twitter.com/user2/status/1002\t2\t0\n'
+            'https://twitter.com/unbekannt/status/1\t5\t1\n')
+    data = {'file': (io.BytesIO(text.encode('utf-8')), 'codierung.txt')}
+    result = client.post('/api/upload-triggers-frames', data=data, content_type='multipart/form-data').get_json()
+
+    assert (result['matched'], result['not_matched']) == (2, 1)
+    assert [p['twitter_url'] for p in result['updated_posts']] == [
+        'https://twitter.com/user1/status/1001', 'https://twitter.com/user2/status/1002'
+    ]
+    assert result['debug']['total_posts_in_db'] == 8
+    assert len(result['debug']['sample_db_urls']) == 3
+
+
+def test_ter_distribution_bins(client):
+    """TER-Bins per SQL: Grenzen gehören zum oberen Bin, archivierte und excluded Posts zählen nicht"""
+    session_id = client.post('/api/sessions', json={'name': 'Verteilung'}).get_json()['session']['id']
+    client.post(f'/api/sessions/{session_id}/activate')
+    values = [0.0, 0.99, 1.0, 4.99, 5.0, 19.9, 20.0, 99.99, 100.0, 5000.0]
+    with app.app_context():
+        for i, ter in enumerate(values):
+            db.session.add(TwitterPost(session_id=session_id, twitter_url=f'https://twitter.com/u/status/{i}', ter_automatic=ter))
+        db.session.add(TwitterPost(session_id=session_id, twitter_url='https://twitter.com/u/status/90', ter_automatic=3.0, is_archived=True))
+        db.session.add(TwitterPost(session_id=session_id, twitter_url='https://twitter.com/u/status/91', ter_automatic=3.0, is_excluded=True))
+        db.session.commit()
+
+    distribution = client.get('/api/stats/distribution').get_json()
+    assert distribution['ter_distribution'] == {
+        '0-1': 2, '1-2': 1, '2-5': 1, '5-10': 1, '10-20': 1, '20-50': 1, '50-100': 1, '100-inf': 2
+    }
+    assert distribution['posts_by_date'] == {}
@@ -0,0 +1,520 @@
+"""
+Test: build_reviewed_excel (write-only, NamedStyles) erzeugt denselben Inhalt wie build_reviewed_excel_legacy
+
+Verglichen werden die gespeicherten Dateien: Sheets, Werte, Schrift, Füllung, Rahmen, Ausrichtung,
+verbundene Zellen, Spaltenbreiten und Zeilenhöhen.
+"""
+import io
+import math
+import random
+import statistics
+from copy import copy
+from datetime import datetime
+
+import pytest
+from openpyxl import load_workbook
+
+import app as app_module
+from app import TwitterPost, TERCalculator, build_reviewed_excel
+
+CREATED_AT = datetime(2024, 5, 17, 9, 30)
+
+
+def make_posts(count, seed=7):
+    """Transiente Posts mit leeren Feldern, manuellen Werten, Triggern/Frames und Notizen"""
+    rnd = random.Random(seed)
+    posts = []
+    for i in range(count):
+        views = rnd.choice([0, 1, 850, 120000])
+        posts.append(TwitterPost(
+            id=i + 1,
+            twitter_url=f'https://twitter.com/user{i}/status/{1000 + i}',
+            twitter_author=rnd.choice([None, f'Autor {i}']),
+            twitter_handle=rnd.choice([None, f'user{i}']),
+            twitter_followers=rnd.choice([None, 0, 12345678]),
+            twitter_content=rnd.choice([None, 'kurz', 'Lang ' * 40, '=kein Formel-Inhalt']),
+            twitter_date=rnd.choice([None, '2023-01-05', '12.03.2022']),
+            access_date=rnd.choice([None, '01.02.2024']),
+            likes=rnd.randint(0, 500), retweets=rnd.randint(0, 50), replies=rnd.randint(0, 50),
+            bookmarks=rnd.randint(0, 20), quotes=rnd.randint(0, 10), views=views,
+            likes_manual=rnd.choice([None, 3]), views_manual=rnd.choice([None, None, 900]),
+            retweets_manual=None, replies_manual=None, bookmarks_manual=None, quotes_manual=None,
+            ter_automatic=rnd.choice([None, 0.0, 4.21]), ter_linear=rnd.choice([None, 1.5]),
+            ter_manual=rnd.choice([None, 0.0, 4.99, 7.5, 12.25, 30.0, -1.0]),
+            weighted_engagement=rnd.randint(0, 900), total_interactions=rnd.randint(0, 600),
+            engagement_level=rnd.choice([None, 'Hohes Engagement']),
+            trigger_angst=rnd.choice([0, 0, 3]), trigger_wut=0, trigger_empoerung=rnd.choice([0, 5]),
+            trigger_ekel=0, trigger_identitaet=0, trigger_hoffnung=rnd.choice([0, None]),
+            frame_opfer_taeter=rnd.choice([0, 1]), frame_bedrohung=0, frame_verschwoerung=0,
+            frame_moral=rnd.choice([0, 1]), frame_historisch=0,
+            notes=rnd.choice([None, '', 'Notiz mit\nZeilenumbruch'])
+        ))
+    return posts
+
+
+def saved(wb):
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    buffer.seek(0)
+    return load_workbook(buffer)
+
+
+def cell_content(cell):
+    # copy(): Style-Proxys der geladenen Zellen in vergleichbare Objekte umwandeln
+    return (cell.value, copy(cell.font), copy(cell.fill), copy(cell.border), copy(cell.alignment), cell.number_format)
+
+
+@pytest.mark.parametrize('count', [1, 40])
+def test_write_only_export_matches_legacy(count):
+    posts = make_posts(count)
+    legacy = saved(build_reviewed_excel_legacy(posts, CREATED_AT))
+    fast = saved(build_reviewed_excel(iter(posts), CREATED_AT))
+
+    assert fast.sheetnames == legacy.sheetnames == ['Zusammenfassung', 'Posts Übersicht', 'Detaillierte Analyse']
+    for name in legacy.sheetnames:
+        expected, actual = legacy[name], fast[name]
+        assert set(map(str, actual.merged_cells.ranges)) == set(map(str, expected.merged_cells.ranges)), name
+
+        widths = {key: dim.width for key, dim in expected.column_dimensions.items()}
+        assert {key: actual.column_dimensions[key].width for key in widths} == widths, name
+
+        heights = {key: dim.height for key, dim in expected.row_dimensions.items() if dim.height}
+        assert {key: dim.height for key, dim in actual.row_dimensions.items() if dim.height} == heights, name
+
+        max_row = max(expected.max_row, actual.max_row)
+        max_column = max(expected.max_column, actual.max_column)
+        for row in range(1, max_row + 1):
+            for column in range(1, max_column + 1):
+                assert cell_content(actual.cell(row, column)) == cell_content(expected.cell(row, column)), \
+                    f'{name}!{expected.cell(row, column).coordinate}'
+
+
+def test_write_only_export_uses_named_styles():
+    wb = saved(build_reviewed_excel(iter(make_posts(3)), CREATED_AT))
+    assert wb['Posts Übersicht']['B2'].style == 'ter_cell_left'
+    assert wb['Detaillierte Analyse']['A1'].style == 'ter_post_header'
+
+
+def test_details_continue_in_next_sheet_at_row_limit(monkeypatch):
+    monkeypatch.setattr(app_module, 'EXCEL_MAX_ROWS', 200)
+    wb = saved(build_reviewed_excel(iter(make_posts(12)), CREATED_AT))
+
+    detail_sheets = [name for name in wb.sheetnames if name.startswith('Detaillierte Analyse')]
+    assert detail_sheets[:2] == ['Detaillierte Analyse', 'Detaillierte Analyse 2']
+
+    headers = []
+    for name in detail_sheets:
+        ws = wb[name]
+        assert ws.max_row <= 200
+        assert ws['A1'].value.startswith('Post #') and 'A1:F1' in ws.merged_cells
+        headers += [cell.value for cell in ws['A'] if isinstance(cell.value, str) and cell.value.startswith('Post #')]
+    assert [header.split(':')[0] for header in headers] == [f'Post #{i}' for i in range(1, 13)]
+
+
+# ==================== REFERENZ: BISHERIGER EXCEL-EXPORT ====================
+
+def build_reviewed_excel_legacy(posts, created_at):
+    """
+    Bisheriger Aufbau des Excel-Exports (Workbook im Speicher, Styles pro Zelle).
+    Referenz für den Vergleich in diesem Test und für benchmark_excel_export.py - siehe app.build_reviewed_excel().
+    """
+    from openpyxl import Workbook
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+
+    # Excel-Workbook erstellen
+    wb = Workbook()
+
+    # Styles definieren
+    header_font = Font(name='Calibri', size=12, bold=True, color='FFFFFF')
+    header_fill = PatternFill(start_color='1e40af', end_color='1e40af', fill_type='solid')
+    subheader_font = Font(name='Calibri', size=11, bold=True, color='FFFFFF')
+    subheader_fill = PatternFill(start_color='3b82f6', end_color='3b82f6', fill_type='solid')
+
+    title_font = Font(name='Calibri', size=16, bold=True, color='1e3a8a')
+    normal_font = Font(name='Calibri', size=10)
+    bold_font = Font(name='Calibri', size=10, bold=True)
+
+    center_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    left_alignment = Alignment(horizontal='left', vertical='top', wrap_text=True)
+
+    thin_border = Border(
+        left=Side(style='thin', color='D0D0D0'),
+        right=Side(style='thin', color='D0D0D0'),
+        top=Side(style='thin', color='D0D0D0'),
+        bottom=Side(style='thin', color='D0D0D0')
+    )
+
+    # ========== SHEET 1: Zusammenfassung ==========
+    ws_summary = wb.active
+    ws_summary.title = "Zusammenfassung"
+
+    # Titel
+    ws_summary['A1'] = 'Twitter Engagement Rate (TER) Analyse - Reviewed Posts'
+    ws_summary['A1'].font = title_font
+    ws_summary.merge_cells('A1:D1')
+
+    ws_summary['A2'] = f'Erstellt am: {created_at.strftime("%d.%m.%Y %H:%M")}'
+    ws_summary['A2'].font = Font(name='Calibri', size=9, italic=True)
+    ws_summary.merge_cells('A2:D2')
+
+    # Statistiken
+    row = 4
+    ws_summary[f'A{row}'] = 'Metrik'
+    ws_summary[f'B{row}'] = 'Wert'
+    ws_summary[f'A{row}'].font = header_font
+    ws_summary[f'B{row}'].font = header_font
+    ws_summary[f'A{row}'].fill = header_fill
+    ws_summary[f'B{row}'].fill = header_fill
+    ws_summary[f'A{row}'].alignment = center_alignment
+    ws_summary[f'B{row}'].alignment = center_alignment
+
+    summary_data = [
+        ('Anzahl reviewed Posts', len(posts)),
+        ('Durchschnittlicher TER',
+         f'{statistics.mean([p.ter_manual for p in posts if p.ter_manual is not None]):.2f}'
+         if any(p.ter_manual is not None for p in posts) else 'N/A'),
+        ('Median TER',
+         f'{statistics.median([p.ter_manual for p in posts if p.ter_manual is not None]):.2f}'
+         if any(p.ter_manual is not None for p in posts) else 'N/A'),
+        ('Min TER',
+         f'{min([p.ter_manual for p in posts if p.ter_manual is not None]):.2f}'
+         if any(p.ter_manual is not None for p in posts) else 'N/A'),
+        ('Max TER',
+         f'{max([p.ter_manual for p in posts if p.ter_manual is not None]):.2f}'
+         if any(p.ter_manual is not None for p in posts) else 'N/A'),
+    ]
+
+    for idx, (label, value) in enumerate(summary_data, start=row+1):
+        ws_summary[f'A{idx}'] = label
+        ws_summary[f'B{idx}'] = value
+        ws_summary[f'A{idx}'].font = bold_font
+        ws_summary[f'A{idx}'].border = thin_border
+        ws_summary[f'B{idx}'].border = thin_border
+        ws_summary[f'B{idx}'].alignment = center_alignment
+
+    ws_summary.column_dimensions['A'].width = 30
+    ws_summary.column_dimensions['B'].width = 20
+
+    # ========== SHEET 2: Alle Posts (Übersicht) ==========
+    ws_overview = wb.create_sheet(title="Posts Übersicht")
+
+    # Header (ohne Follower)
+    headers = [
+        '#', 'Autor', 'Handle', 'Veröffentlichungsdatum',
+        'Zugriffsdatum', 'TER Manuell', 'TER Auto', 'TER Linear',
+        'Views', 'Likes', 'Bookmarks', 'Replies', 'Retweets', 'Quotes',
+        'Weighted Engagement', 'Total Interactions', 'Engagement Level',
+        'Twitter URL', 'Content (Vorschau)'
+    ]
+
+    for col_num, header in enumerate(headers, start=1):
+        cell = ws_overview.cell(row=1, column=col_num)
+        cell.value = header
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = center_alignment
+        cell.border = thin_border
+
+    # Daten
+    for idx, post in enumerate(posts, start=2):
+        # Verwende manuelle Werte falls vorhanden
+        views = post.views_manual if post.views_manual is not None else post.views
+        likes = post.likes_manual if post.likes_manual is not None else post.likes
+        retweets = post.retweets_manual if post.retweets_manual is not None else post.retweets
+        replies = post.replies_manual if post.replies_manual is not None else post.replies
+        bookmarks = post.bookmarks_manual if post.bookmarks_manual is not None else post.bookmarks
+        quotes = post.quotes_manual if post.quotes_manual is not None else post.quotes
+
+        content_preview = (post.twitter_content[:100] + '...') if post.twitter_content and len(post.twitter_content) > 100 else (post.twitter_content or '')
+
+        row_data = [
+            idx - 1,
+            post.twitter_author or 'N/A',
+            post.twitter_handle or 'N/A',
+            post.twitter_date or 'N/A',
+            post.access_date or 'N/A',
+            post.ter_manual if post.ter_manual is not None else 'N/A',
+            post.ter_automatic,
+            post.ter_linear,
+            views,
+            likes,
+            bookmarks,
+            replies,
+            retweets,
+            quotes,
+            post.weighted_engagement,
+            post.total_interactions,
+            post.engagement_level or 'N/A',
+            post.twitter_url or 'N/A',
+            content_preview
+        ]
+
+        for col_num, value in enumerate(row_data, start=1):
+            cell = ws_overview.cell(row=idx, column=col_num)
+            cell.value = value
+            cell.font = normal_font
+            cell.border = thin_border
+
+            if col_num in [1, 4, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17]:  # Numerische/Center Spalten
+                cell.alignment = center_alignment
+            else:
+                cell.alignment = left_alignment
+
+    # Spaltenbreiten
+    ws_overview.column_dimensions['A'].width = 5
+    ws_overview.column_dimensions['B'].width = 20
+    ws_overview.column_dimensions['C'].width = 15
+    ws_overview.column_dimensions['D'].width = 12
+    ws_overview.column_dimensions['E'].width = 18
+    ws_overview.column_dimensions['F'].width = 15
+    ws_overview.column_dimensions['G'].width = 12
+    ws_overview.column_dimensions['H'].width = 12
+    ws_overview.column_dimensions['I'].width = 12
+    ws_overview.column_dimensions['J'].width = 12
+    ws_overview.column_dimensions['K'].width = 10
+    ws_overview.column_dimensions['L'].width = 12
+    ws_overview.column_dimensions['M'].width = 10
+    ws_overview.column_dimensions['N'].width = 12
+    ws_overview.column_dimensions['O'].width = 10
+    ws_overview.column_dimensions['P'].width = 18
+    ws_overview.column_dimensions['Q'].width = 16
+    ws_overview.column_dimensions['R'].width = 30
+    ws_overview.column_dimensions['S'].width = 40
+    ws_overview.column_dimensions['T'].width = 50
+
+    # ========== SHEET 3: Detaillierte Post-Analyse ==========
+    ws_details = wb.create_sheet(title="Detaillierte Analyse")
+
+    current_row = 1
+
+    for post_idx, post in enumerate(posts, start=1):
+        # Post-Header
+        ws_details.merge_cells(f'A{current_row}:F{current_row}')
+        header_cell = ws_details[f'A{current_row}']
+        header_cell.value = f'Post #{post_idx}: {post.twitter_author or "Unbekannt"}'
+        header_cell.font = Font(name='Calibri', size=14, bold=True, color='FFFFFF')
+        header_cell.fill = PatternFill(start_color='1e40af', end_color='1e40af', fill_type='solid')
+        header_cell.alignment = center_alignment
+        current_row += 1
+
+        # Grundinformationen
+        ws_details[f'A{current_row}'] = 'Grundinformationen'
+        ws_details[f'A{current_row}'].font = subheader_font
+        ws_details[f'A{current_row}'].fill = subheader_fill
+        ws_details.merge_cells(f'A{current_row}:B{current_row}')
+        current_row += 1
+
+        info_data = [
+            ('Autor', post.twitter_author or 'N/A'),
+            ('Handle', post.twitter_handle or 'N/A'),
+            ('Follower', f'{post.twitter_followers:,}'.replace(',', '.') if post.twitter_followers else 'N/A'),
+            ('Veröffentlichungsdatum', post.twitter_date or 'N/A'),
+            ('Zugriffsdatum', post.access_date or 'N/A'),
+            ('Twitter URL', post.twitter_url or 'N/A'),
+        ]
+
+        for label, value in info_data:
+            ws_details[f'A{current_row}'] = label
+            ws_details[f'B{current_row}'] = value
+            ws_details[f'A{current_row}'].font = bold_font
+            ws_details[f'A{current_row}'].border = thin_border
+            ws_details[f'B{current_row}'].border = thin_border
+            ws_details[f'B{current_row}'].alignment = left_alignment
+            current_row += 1
+
+        # Post-Inhalt
+        ws_details[f'A{current_row}'] = 'Post-Inhalt'
+        ws_details[f'A{current_row}'].font = bold_font
+        current_row += 1
+
+        ws_details[f'A{current_row}'] = post.twitter_content or 'Kein Inhalt verfügbar'
+        ws_details[f'A{current_row}'].alignment = Alignment(horizontal='left', vertical='top', wrap_text=True)
+        ws_details.merge_cells(f'A{current_row}:F{current_row}')
+        ws_details.row_dimensions[current_row].height = 60
+        current_row += 2
+
+        # Engagement-Metriken
+        ws_details[f'A{current_row}'] = 'Engagement-Metriken (manuell erfasst)'
+        ws_details[f'A{current_row}'].font = subheader_font
+        ws_details[f'A{current_row}'].fill = subheader_fill
+        ws_details.merge_cells(f'A{current_row}:C{current_row}')
+        current_row += 1
+
+        # Header für Metriken
+        ws_details[f'A{current_row}'] = 'Metrik'
+        ws_details[f'B{current_row}'] = 'Wert'
+        ws_details[f'C{current_row}'] = 'Gewichtung'
+        for col in ['A', 'B', 'C']:
+            ws_details[f'{col}{current_row}'].font = bold_font
+            ws_details[f'{col}{current_row}'].fill = PatternFill(start_color='E0E7FF', end_color='E0E7FF', fill_type='solid')
+            ws_details[f'{col}{current_row}'].alignment = center_alignment
+            ws_details[f'{col}{current_row}'].border = thin_border
+        current_row += 1
+
+        # Verwende manuelle Werte falls vorhanden
+        views = post.views_manual if post.views_manual is not None else post.views
+        likes = post.likes_manual if post.likes_manual is not None else post.likes
+        retweets = post.retweets_manual if post.retweets_manual is not None else post.retweets
+        replies = post.replies_manual if post.replies_manual is not None else post.replies
+        bookmarks = post.bookmarks_manual if post.bookmarks_manual is not None else post.bookmarks
+        quotes = post.quotes_manual if post.quotes_manual is not None else post.quotes
+
+        metrics_data = [
+            ('Views (Impressionen)', views, '-'),
+            ('Likes', likes, '× 1'),
+            ('Bookmarks', bookmarks, '× 2'),
+            ('Replies', replies, '× 3'),
+            ('Retweets', retweets, '× 4'),
+            ('Quote Tweets', quotes, '× 5'),
+        ]
+
+        for metric, value, weight in metrics_data:
+            ws_details[f'A{current_row}'] = metric
+            ws_details[f'B{current_row}'] = value
+            ws_details[f'C{current_row}'] = weight
+            ws_details[f'A{current_row}'].border = thin_border
+            ws_details[f'B{current_row}'].border = thin_border
+            ws_details[f'C{current_row}'].border = thin_border
+            ws_details[f'B{current_row}'].alignment = center_alignment
+            ws_details[f'C{current_row}'].alignment = center_alignment
+            current_row += 1
+
+        current_row += 1
+
+        # TER-Berechnung
+        ws_details[f'A{current_row}'] = 'TER-Berechnung (Twitter Engagement Rate)'
+        ws_details[f'A{current_row}'].font = subheader_font
+        ws_details[f'A{current_row}'].fill = subheader_fill
+        ws_details.merge_cells(f'A{current_row}:C{current_row}')
+        current_row += 1
+
+        weighted_engagement = (
+            (likes * 1) + (bookmarks * 2) + (replies * 3) +
+            (retweets * 4) + (quotes * 5)
+        )
+        ter_sqrt = weighted_engagement / math.sqrt(views) if views > 0 else 0
+        ter_manual = post.ter_manual if post.ter_manual is not None else ter_sqrt
+
+        ter_calc_data = [
+            ('Formel', 'TER√ = Gewichtetes Engagement / √Views'),
+            ('Berechnung', f'TER√ = {weighted_engagement:,} / √{views:,} = {ter_sqrt:.2f}'.replace(',', '.')),
+            ('Gewichtetes Engagement', f'{weighted_engagement:,}'.replace(',', '.')),
+            ('Manueller TER-Wert' if post.ter_manual is not None else 'TER-Wert', f'{ter_manual:.2f}'),
+        ]
+
+        for label, value in ter_calc_data:
+            ws_details[f'A{current_row}'] = label
+            ws_details[f'B{current_row}'] = value
+            ws_details[f'A{current_row}'].font = bold_font
+            ws_details[f'A{current_row}'].border = thin_border
+            ws_details[f'B{current_row}'].border = thin_border
+            ws_details.merge_cells(f'B{current_row}:C{current_row}')
+            current_row += 1
+
+        # TER-Interpretation
+        engagement_level = TERCalculator.get_engagement_level(ter_manual)
+        ws_details[f'A{current_row}'] = 'Interpretation'
+        ws_details[f'A{current_row}'].font = bold_font
+        current_row += 1
+
+        ws_details[f'A{current_row}'] = engagement_level['label']
+        ws_details.merge_cells(f'A{current_row}:C{current_row}')
+
+        # Farbcodierung
+        level_colors = {
+            'low': '93c5fd',
+            'medium': '86efac',
+            'high': 'fdba74',
+            'very_high': 'fca5a5'
+        }
+        ws_details[f'A{current_row}'].fill = PatternFill(
+            start_color=level_colors.get(engagement_level['code'], 'D0D0D0'),
+            end_color=level_colors.get(engagement_level['code'], 'D0D0D0'),
+            fill_type='solid'
+        )
+        ws_details[f'A{current_row}'].font = Font(name='Calibri', size=11, bold=True)
+        ws_details[f'A{current_row}'].alignment = center_alignment
+        current_row += 1
+
+        ws_details[f'A{current_row}'] = engagement_level['description']
+        ws_details.merge_cells(f'A{current_row}:C{current_row}')
+        current_row += 2
+
+        # Trigger (falls vorhanden)
+        if any([post.trigger_angst, post.trigger_wut, post.trigger_empoerung, post.trigger_ekel,
+                post.trigger_identitaet, post.trigger_hoffnung]):
+            ws_details[f'A{current_row}'] = 'Emotionale Trigger (Intensität 0-5)'
+            ws_details[f'A{current_row}'].font = subheader_font
+            ws_details[f'A{current_row}'].fill = subheader_fill
+            ws_details.merge_cells(f'A{current_row}:B{current_row}')
+            current_row += 1
+
+            trigger_data = [
+                ('Angst', post.trigger_angst),
+                ('Wut', post.trigger_wut),
+                ('Empörung', post.trigger_empoerung),
+                ('Ekel', post.trigger_ekel),
+                ('Identitätsbezug', post.trigger_identitaet),
+                ('Hoffnung/Stolz', post.trigger_hoffnung),
+            ]
+
+            for label, value in trigger_data:
+                ws_details[f'A{current_row}'] = label
+                ws_details[f'B{current_row}'] = value
+                ws_details[f'A{current_row}'].border = thin_border
+                ws_details[f'B{current_row}'].border = thin_border
+                ws_details[f'B{current_row}'].alignment = center_alignment
+                current_row += 1
+
+            current_row += 1
+
+        # Frames (falls vorhanden)
+        if any([post.frame_opfer_taeter, post.frame_bedrohung, post.frame_verschwoerung,
+                post.frame_moral, post.frame_historisch]):
+            ws_details[f'A{current_row}'] = 'Narrative Frames (✓ = vorhanden)'
+            ws_details[f'A{current_row}'].font = subheader_font
+            ws_details[f'A{current_row}'].fill = subheader_fill
+            ws_details.merge_cells(f'A{current_row}:B{current_row}')
+            current_row += 1
+
+            frame_data = [
+                ('Opfer-Täter Frame', '✓' if post.frame_opfer_taeter else '✗'),
+                ('Bedrohungs-Frame', '✓' if post.frame_bedrohung else '✗'),
+                ('Verschwörungs-Frame', '✓' if post.frame_verschwoerung else '✗'),
+                ('Moral-Frame', '✓' if post.frame_moral else '✗'),
+                ('Historischer Frame', '✓' if post.frame_historisch else '✗'),
+            ]
+
+            for label, value in frame_data:
+                ws_details[f'A{current_row}'] = label
+                ws_details[f'B{current_row}'] = value
+                ws_details[f'A{current_row}'].border = thin_border
+                ws_details[f'B{current_row}'].border = thin_border
+                ws_details[f'B{current_row}'].alignment = center_alignment
+                current_row += 1
+
+            current_row += 1
+
+        # Notizen (falls vorhanden)
+        if post.notes:
+            ws_details[f'A{current_row}'] = 'Notizen'
+            ws_details[f'A{current_row}'].font = bold_font
+            current_row += 1
+
+            ws_details[f'A{current_row}'] = post.notes
+            ws_details[f'A{current_row}'].alignment = Alignment(horizontal='left', vertical='top', wrap_text=True)
+            ws_details.merge_cells(f'A{current_row}:F{current_row}')
+            current_row += 1
+
+        # Trenner zwischen Posts
+        current_row += 3
+
+    # Spaltenbreiten für Details-Sheet
+    ws_details.column_dimensions['A'].width = 30
+    ws_details.column_dimensions['B'].width = 35
+    ws_details.column_dimensions['C'].width = 20
+    ws_details.column_dimensions['D'].width = 20
+    ws_details.column_dimensions['E'].width = 20
+    ws_details.column_dimensions['F'].width = 20
+
+    return wb
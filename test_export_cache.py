@@ -0,0 +1,99 @@
+"""
+Test: Export-Cache - wiederholte Exporte kommen ohne erneutes Rendern aus der Cache-Datei,
+If-None-Match liefert 304, Änderungen an Posts erzeugen einen neuen Cache-Eintrag, LRU-Verdrängung
+"""
+import os
+
+import pytest
+
+import app as app_module
+from app import app, db, TwitterPost, evict_export_cache
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setitem(app.config, 'EXPORT_DIR', str(tmp_path))
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    client = app.test_client()
+    session_id = client.post('/api/sessions', json={'name': 'Cache-Test'}).get_json()['session']['id']
+    client.post(f'/api/sessions/{session_id}/activate')
+    with app.app_context():
+        for i in range(5):
+            db.session.add(TwitterPost(
+                session_id=session_id, is_reviewed=True, is_favorite=i % 2 == 0,
+                twitter_url=f'https://twitter.com/user{i}/status/{1000 + i}', twitter_handle=f'user{i}',
+                twitter_content=f'Inhalt {i}', likes=i, views=100 * i, ter_manual=float(i)
+            ))
+        db.session.commit()
+    yield client, tmp_path
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+def cache_files(tmp_path):
+    return sorted(name for name in os.listdir(tmp_path) if not name.startswith('tmp-'))
+
+
+@pytest.mark.parametrize('url', ['/api/posts/reviewed/export-csv', '/api/posts/favorites/export'])
+def test_csv_export_is_cached(client, url):
+    client, tmp_path = client
+
+    first = client.get(url)
+    assert first.status_code == 200 and 'Content-Length' not in first.headers  # gestreamt
+    etag = first.headers['ETag']
+    assert first.data.startswith(b'factcheck_url,')  # Cache-Datei entsteht beim Streamen
+    assert len(cache_files(tmp_path)) == 1
+
+    second = client.get(url)
+    assert second.status_code == 200 and second.content_length == len(first.data)  # Cache-Datei
+    assert second.headers['ETag'] == etag
+    assert second.headers['Content-Type'] == 'text/csv; charset=utf-8'
+    assert second.data == first.data
+
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+
+def test_excel_export_renders_only_on_cache_miss(client, monkeypatch):
+    client, tmp_path = client
+    calls = []
+    build_reviewed_excel = app_module.build_reviewed_excel
+    monkeypatch.setattr(app_module, 'build_reviewed_excel', lambda *args: calls.append(1) or build_reviewed_excel(*args))
+
+    first = client.get('/api/posts/reviewed/export-excel')
+    second = client.get('/api/posts/reviewed/export-excel')
+    assert first.status_code == second.status_code == 200
+    assert second.data == first.data and second.headers['ETag'] == first.headers['ETag']
+    assert len(calls) == 1
+
+    not_modified = client.get('/api/posts/reviewed/export-excel', headers={'If-None-Match': first.headers['ETag']})
+    assert not_modified.status_code == 304 and not not_modified.data
+    assert len(calls) == 1
+
+    # Änderung an einem Post: neuer Inhalts-Hash, neu gerendert, alter ETag passt nicht mehr
+    assert client.put('/api/posts/1', json={'notes': 'geändert'}).status_code == 200
+    changed = client.get('/api/posts/reviewed/export-excel', headers={'If-None-Match': first.headers['ETag']})
+    assert changed.status_code == 200
+    assert changed.headers['ETag'] != first.headers['ETag']
+    assert len(calls) == 2
+    assert len(cache_files(tmp_path)) == 2
+
+
+def test_lru_eviction(client, monkeypatch):
+    _, tmp_path = client
+    for number in range(4):
+        path = tmp_path / f'1_reviewed_csv_{number}.csv'
+        path.write_bytes(b'x' * 100)
+        os.utime(path, (1000 + number, 1000 + number))
+    (tmp_path / 'tmp-laufend.pdf').write_bytes(b'x' * 1000)
+
+    # Zuletzt benutzt (Cache-Treffer setzt mtime) bleibt erhalten
+    with app.app_context():
+        assert app_module.export_cache_hit(str(tmp_path / '1_reviewed_csv_0.csv'))
+        monkeypatch.setitem(app.config, 'EXPORT_CACHE_MAX_BYTES', 250)
+        evict_export_cache()
+
+    assert cache_files(tmp_path) == ['1_reviewed_csv_0.csv', '1_reviewed_csv_3.csv']
+    assert os.path.exists(tmp_path / 'tmp-laufend.pdf')
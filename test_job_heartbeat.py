@@ -0,0 +1,91 @@
+"""
+Test: Hintergrund-Jobs gelten nur ohne aktuelles Lebenszeichen (heartbeat_at) als abgebrochen -
+unabhängig davon, ob sie im eigenen Prozess laufen (JOB_FUTURES)
+"""
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+import app as app_module
+from app import app, db, AnalysisJob, AnalysisSession, mark_orphaned_job, send_job_heartbeats
+
+
+@pytest.fixture
+def client():
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    client = app.test_client()
+    session_id = client.post('/api/sessions', json={'name': 'Heartbeat'}).get_json()['session']['id']
+    client.post(f'/api/sessions/{session_id}/activate')
+    yield client, session_id
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+def add_job(session_id, kind, seconds_since_heartbeat, owner='anderer-server:4711'):
+    """Offener Job eines anderen Prozesses mit Lebenszeichen vor x Sekunden (None = ohne heartbeat_at)"""
+    now = datetime.utcnow()
+    with app.app_context():
+        session = db.session.get(AnalysisSession, session_id)
+        job = AnalysisJob(
+            id=uuid.uuid4().hex, session_id=session_id, kind=kind, data_version=session.data_version or 0,
+            status='running', owner=owner, created_at=now - timedelta(hours=1),
+            heartbeat_at=None if seconds_since_heartbeat is None else now - timedelta(seconds=seconds_since_heartbeat)
+        )
+        db.session.add(job)
+        db.session.commit()
+        return job.id
+
+
+def job_status(job_id):
+    with app.app_context():
+        return db.session.get(AnalysisJob, job_id).status
+
+
+def test_jobs_of_other_processes_are_reused(client):
+    client, session_id = client
+    advanced = add_job(session_id, 'advanced_stats', 5)
+    pdf = add_job(session_id, 'reviewed_pdf', 5)
+    assert advanced not in app_module.JOB_FUTURES and pdf not in app_module.JOB_FUTURES
+
+    response = client.post('/api/stats/advanced/jobs')
+    assert response.status_code == 202 and response.get_json()['job']['id'] == advanced
+    response = client.post('/api/posts/reviewed/export-pdf/jobs')
+    assert response.status_code == 202 and response.get_json()['job']['id'] == pdf
+    assert response.get_json()['job']['owner'] == 'anderer-server:4711'
+    assert job_status(advanced) == job_status(pdf) == 'running'
+
+
+@pytest.mark.parametrize('kind', ['advanced_stats', 'reviewed_pdf'])
+@pytest.mark.parametrize('seconds_since_heartbeat', [61, None])
+def test_stale_jobs_are_orphaned(client, kind, seconds_since_heartbeat):
+    client, session_id = client
+    job_id = add_job(session_id, kind, seconds_since_heartbeat)
+
+    with app.app_context():
+        job = db.session.get(AnalysisJob, job_id)
+        mark_orphaned_job(job)
+        assert job.status == 'error'
+        assert 'anderer-server:4711' in job.error
+        assert job.finished_at is not None
+
+
+def test_heartbeat_keeps_local_jobs_alive(client, monkeypatch):
+    client, session_id = client
+    local = add_job(session_id, 'advanced_stats', 50, owner=app_module.job_owner())
+    foreign = add_job(session_id, 'reviewed_pdf', 50)
+    monkeypatch.setitem(app_module.JOB_FUTURES, local, None)
+    monkeypatch.setitem(app.config, 'JOB_HEARTBEAT_TIMEOUT', 30)
+
+    send_job_heartbeats()
+
+    with app.app_context():
+        for job_id in (local, foreign):
+            mark_orphaned_job(db.session.get(AnalysisJob, job_id))
+        local_job = db.session.get(AnalysisJob, local)
+        assert datetime.utcnow() - local_job.heartbeat_at < timedelta(seconds=5)
+    assert job_status(local) == 'running'
+    assert job_status(foreign) == 'error'  # läuft nicht in diesem Prozess, kein neues Lebenszeichen
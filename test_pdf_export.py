@@ -0,0 +1,133 @@
+"""
+Test: PDF-Export - parallel gerenderte und zusammengeführte Chunks ergeben dasselbe PDF wie das
+sequentielle Rendern in einem Stück (Seiten, Text, durchgehende Seitenzahlen), Export-Job mit Fortschritt
+"""
+import io
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import pytest
+
+pypdf = pytest.importorskip('pypdf')
+
+from app import app, db, TwitterPost, PDF_POST_FIELDS, render_reviewed_pdf
+
+CREATED_AT = datetime(2024, 5, 17, 9, 30)
+
+
+def make_posts(count):
+    """Post-Dicts wie aus load_pdf_export_data, einige mit langen Begründungen/Notizen (mehrseitig)"""
+    posts = []
+    for i in range(count):
+        post = dict.fromkeys(PDF_POST_FIELDS)
+        post.update(
+            twitter_author=f'Autor {i}' if i % 4 else None,
+            twitter_handle=f'user{i}',
+            twitter_date='2023-01-05',
+            twitter_url=f'https://twitter.com/user{i}/status/{1000 + i}',
+            views=0 if i == 3 else 1000 + 37 * i, likes=i, retweets=i % 5, replies=i % 4, bookmarks=i % 3, quotes=i % 2,
+            likes_manual=7 if i % 6 == 0 else None,
+            ter_manual=None if i % 5 == 0 else float(i % 20),
+            trigger_angst=i % 4, trigger_wut=0, trigger_empoerung=i % 6, trigger_ekel=0,
+            trigger_identitaet=0, trigger_hoffnung=0,
+            trigger_angst_begruendung='Begründung ' * (i * 15),
+            frame_opfer_taeter=i % 2, frame_bedrohung=0, frame_verschwoerung=0, frame_moral=int(i % 3 == 0), frame_historisch=0,
+            frame_opfer_taeter_begruendung='Frame-Begründung',
+            notes='Notiz ' * (i * 40) if i % 3 == 0 else None
+        )
+        posts.append(post)
+    return posts
+
+
+def summary_for(posts):
+    return {'count': len(posts), 'mean': 4.25, 'median': 3.0}
+
+
+def page_texts(path):
+    return [page.extract_text() for page in pypdf.PdfReader(path).pages]
+
+
+def test_chunked_rendering_matches_sequential(tmp_path, monkeypatch):
+    monkeypatch.setitem(app.config, 'PDF_CHUNK_POSTS', 4)
+    posts = make_posts(11)
+
+    sequential_path = str(tmp_path / 'sequential.pdf')
+    sequential_pages = render_reviewed_pdf(sequential_path, posts, summary_for(posts), CREATED_AT)
+
+    progress = []
+    chunked_path = str(tmp_path / 'chunked.pdf')
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('spawn')) as executor:
+        chunked_pages = render_reviewed_pdf(
+            chunked_path, posts, summary_for(posts), CREATED_AT,
+            executor=executor, progress=lambda done, total: progress.append((done, total))
+        )
+
+    assert chunked_pages == sequential_pages > len(posts)
+    assert page_texts(chunked_path) == page_texts(sequential_path)
+    for number, text in enumerate(page_texts(chunked_path), start=1):
+        assert f'Seite {number} von {chunked_pages}' in text
+    assert 'Erklärung: Narrative Frames' in page_texts(chunked_path)[0] + page_texts(chunked_path)[1]
+
+    # 3 Chunks rendern + 3 Chunks nummerieren + Zusammenführen, Teil-Dateien sind aufgeräumt
+    assert progress[-1] == (7, 7)
+    assert [done for done, _ in progress] == [1, 2, 3, 4, 5, 6, 7]
+    assert sorted(os.listdir(tmp_path)) == ['chunked.pdf', 'sequential.pdf']
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setitem(app.config, 'PDF_CHUNK_POSTS', 3)
+    monkeypatch.setitem(app.config, 'EXPORT_DIR', str(tmp_path))
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    client = app.test_client()
+    session_id = client.post('/api/sessions', json={'name': 'PDF-Test'}).get_json()['session']['id']
+    client.post(f'/api/sessions/{session_id}/activate')
+    yield client, session_id
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+def test_pdf_export_job(client):
+    client, session_id = client
+    assert client.post('/api/posts/reviewed/export-pdf/jobs').status_code == 404
+
+    with app.app_context():
+        for data in make_posts(8):
+            db.session.add(TwitterPost(session_id=session_id, is_reviewed=True, **data))
+        db.session.commit()
+
+    response = client.post('/api/posts/reviewed/export-pdf/jobs')
+    assert response.status_code == 202
+    job = response.get_json()['job']
+
+    deadline = time.time() + 120
+    while job['status'] in ('pending', 'running') and time.time() < deadline:
+        time.sleep(0.2)
+        job = client.get(f"/api/jobs/{job['id']}").get_json()['job']
+
+    assert job['status'] == 'done', job
+    assert job['progress'] == job['progress_total'] == 7  # 3 Chunks rendern und nummerieren + Zusammenführen
+    assert job['result']['posts'] == 8
+
+    download = client.get(f"/api/jobs/{job['id']}/download")
+    assert download.status_code == 200
+    assert download.headers['Content-Type'] == 'application/pdf'
+    assert download.data.startswith(b'%PDF')
+
+    # Gleicher Datenstand: fertiger Job wird wiederverwendet
+    again = client.post('/api/posts/reviewed/export-pdf/jobs')
+    assert again.status_code == 200
+    assert again.get_json()['job']['id'] == job['id']
+
+    # Synchroner Export liefert denselben Report - aus dem Export-Cache, ohne erneutes Rendern
+    direct = client.get('/api/posts/reviewed/export-pdf')
+    assert direct.status_code == 200
+    assert direct.headers['ETag'] == download.headers['ETag'] == f'"{job["result"]["etag"]}"'
+    assert direct.data == download.data
+    assert len(pypdf.PdfReader(io.BytesIO(direct.data)).pages) > 8
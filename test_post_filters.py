@@ -0,0 +1,144 @@
+"""
+Test: Filter-Parameter von /api/posts (apply_post_filters) - jeder Filter einzeln und kombiniert mit
+Keyset-Paginierung gegen dieselbe Filterung in Python über die vollständige Liste;
+Handle- und Faktenchecker-Listen (/api/handles, /api/factcheckers) mit Anzahl Posts
+"""
+import random
+from collections import Counter
+from datetime import datetime
+
+import pytest
+
+from app import app, db, TwitterPost, FACTCHECKER_MAPPING
+
+FACTCHECK_URLS = [
+    'https://correctiv.org/faktencheck/1', 'https://www.correctiv.org/faktencheck/2', 'http://correctiv.org',
+    'https://mimikama.at/artikel', 'https://factuel.afp.com/doc', 'https://notcorrectiv.org/x', None
+]
+
+
+@pytest.fixture(scope='module')
+def client():
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    client = app.test_client()
+    session_id = client.post('/api/sessions', json={'name': 'Filter-Test'}).get_json()['session']['id']
+    client.post(f'/api/sessions/{session_id}/activate')
+
+    rnd = random.Random(3)
+    with app.app_context():
+        for i in range(120):
+            day = rnd.choice([None, datetime(2023, 1, 5), datetime(2023, 1, 31, 23, 59), datetime(2023, 2, 1), datetime(2024, 6, 1)])
+            db.session.add(TwitterPost(
+                session_id=session_id, twitter_url=f'https://twitter.com/user{i}/status/{i}',
+                twitter_handle=rnd.choice(['alice', 'bob', 'carl', None]),
+                factcheck_url=rnd.choice(FACTCHECK_URLS),
+                twitter_datetime=day, twitter_date=day.strftime('%Y-%m-%d') if day else None,
+                ter_automatic=rnd.choice([None, 0.0, 1.5, 4.0, 12.0]), ter_manual=rnd.choice([None, 2.0, 8.0]),
+                views=rnd.choice([0, 100, 5000]), twitter_followers=rnd.randint(0, 1000),
+                trigger_angst=rnd.choice([0, 0, 3]), trigger_wut=rnd.choice([0, 2]), frame_moral=rnd.choice([0, 1]),
+                is_reviewed=rnd.random() < 0.5, is_excluded=rnd.random() < 0.2, is_favorite=rnd.random() < 0.3,
+                is_archived=i % 17 == 0
+            ))
+        db.session.commit()
+    yield client
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+def all_posts(client):
+    return client.get('/api/posts', query_string={'fields': 'full'}).get_json()['posts']
+
+
+def in_range(value, low=None, high=None):
+    return value is not None and (low is None or value >= low) and (high is None or value <= high)
+
+
+def domain_of(url):
+    if not url:
+        return None
+    host = url.split('://', 1)[1].split('/', 1)[0]
+    return host[4:] if host.startswith('www.') else host
+
+
+FILTER_CASES = [
+    ({'reviewed': 'true'}, lambda p: p['is_reviewed']),
+    ({'reviewed': 'all', 'excluded': 'false'}, lambda p: not p['is_excluded']),
+    ({'favorite': 'true', 'reviewed': 'false'}, lambda p: p['is_favorite'] and not p['is_reviewed']),
+    ({'handles': 'alice,@bob'}, lambda p: p['twitter_handle'] in ('alice', 'bob')),
+    ({'handles': ''}, lambda p: False),
+    ({'factcheckers': 'correctiv.org'}, lambda p: domain_of(p['factcheck_url']) == 'correctiv.org'),
+    ({'factcheckers': 'mimikama.at,factuel.afp.com'},
+     lambda p: domain_of(p['factcheck_url']) in ('mimikama.at', 'factuel.afp.com')),
+    ({'ter_min': '1.5', 'ter_max': '4'}, lambda p: in_range(p['ter_automatic'], 1.5, 4)),
+    ({'ter_manual_min': '5'}, lambda p: in_range(p['ter_manual'], 5)),
+    ({'views_max': '100', 'followers_min': '500'},
+     lambda p: in_range(p['views'], high=100) and in_range(p['twitter_followers'], 500)),
+    ({'date_from': '2023-01-01', 'date_to': '2023-01-31'},
+     lambda p: p['twitter_date'] is not None and '2023-01-01' <= p['twitter_date'] <= '2023-01-31'),
+    ({'triggers': 'angst,wut'}, lambda p: p['trigger_angst'] > 0 and p['trigger_wut'] > 0),
+    ({'frames': 'moral', 'handles': 'carl', 'reviewed': 'true'},
+     lambda p: p['frame_moral'] > 0 and p['twitter_handle'] == 'carl' and p['is_reviewed']),
+]
+
+
+@pytest.mark.parametrize('params, predicate', FILTER_CASES)
+def test_filter_matches_python_reference(client, params, predicate):
+    expected = [p['id'] for p in all_posts(client) if predicate(p)]
+    result = client.get('/api/posts', query_string={**params, 'fields': 'id'}).get_json()
+    assert [p['id'] for p in result['posts']] == expected
+    assert result['total'] == len(expected)
+
+
+def test_filters_combine_with_keyset_pagination(client):
+    params = {'reviewed': 'true', 'handles': 'alice,bob,carl', 'views_min': '100', 'sort': 'ter_automatic', 'order': 'desc'}
+    full = client.get('/api/posts', query_string={**params, 'fields': 'id'}).get_json()
+    assert full['total'] > 5
+
+    ids, cursor = [], None
+    while True:
+        page = client.get('/api/posts', query_string={**params, 'fields': 'id', 'limit': 4, 'cursor': cursor or ''}).get_json()
+        assert page['total'] == full['total']
+        ids += [p['id'] for p in page['posts']]
+        cursor = page['next_cursor']
+        if not cursor:
+            break
+    assert ids == [p['id'] for p in full['posts']]
+
+
+def test_archived_and_favorites_accept_filters(client):
+    archived = client.get('/api/posts/archived', query_string={'reviewed': 'true', 'fields': 'full'}).get_json()['posts']
+    assert archived and all(p['is_archived'] and p['is_reviewed'] for p in archived)
+
+
+@pytest.mark.parametrize('params', [
+    {'reviewed': 'vielleicht'}, {'ter_min': 'hoch'}, {'date_from': '05.01.2023'}, {'triggers': 'freude'},
+    {'ter_min': 'nan'}, {'views_max': 'inf'}, {'ter_max': '-Infinity'}
+])
+def test_invalid_filter_values(client, params):
+    response = client.get('/api/posts', query_string=params)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_handle_and_factchecker_lists(client):
+    posts = all_posts(client)
+
+    handles = client.get('/api/handles').get_json()
+    expected = Counter(p['twitter_handle'] for p in posts if p['twitter_handle'])
+    assert handles['handles'] == sorted(expected)
+    assert handles['counts'] == dict(expected)
+
+    factcheckers = client.get('/api/factcheckers').get_json()['factcheckers']
+    expected = Counter(domain_of(p['factcheck_url']) for p in posts if p['factcheck_url'])
+    assert {f['domain']: f['count'] for f in factcheckers} == dict(expected)
+    assert [f['name'] for f in factcheckers] == sorted(FACTCHECKER_MAPPING.get(d, d) for d in expected)
+    assert {'domain': 'correctiv.org', 'name': 'Germany, Correctiv', 'count': expected['correctiv.org']} in factcheckers
+
+    # Gecacht pro Datenversion: Archivieren ändert die Zählung
+    post = next(p for p in posts if p['twitter_handle'] == 'alice')
+    assert client.put(f"/api/posts/{post['id']}", json={'is_archived': True}).status_code == 200
+    assert client.get('/api/handles').get_json()['counts']['alice'] == handles['counts']['alice'] - 1
+    client.put(f"/api/posts/{post['id']}", json={'is_archived': False})
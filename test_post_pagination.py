@@ -0,0 +1,93 @@
+"""
+Test: Cursor-Paginierung von /api/posts - Cursor-Token hin und zurück, alle Seiten ergeben die
+vollständige Liste, manipulierte Cursor liefern 400
+"""
+import base64
+import json
+from datetime import datetime
+
+import pytest
+
+from app import app, db, TwitterPost, encode_cursor, decode_cursor, InvalidCursorError
+
+
+@pytest.fixture(scope='module')
+def client():
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    client = app.test_client()
+    session_id = client.post('/api/sessions', json={'name': 'Paginierung'}).get_json()['session']['id']
+    client.post(f'/api/sessions/{session_id}/activate')
+
+    now = datetime(2024, 5, 1, 12, 0, 0)  # ganzer Import mit gleichem created_at
+    with app.app_context():
+        for i in range(23):
+            db.session.add(TwitterPost(
+                session_id=session_id, twitter_url=f'https://twitter.com/user/status/{i}', created_at=now,
+                ter_manual=None if i % 4 == 0 else float(i % 5), views=i % 3 * 100
+            ))
+        db.session.commit()
+    yield client
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+def make_token(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii').rstrip('=')
+
+
+@pytest.mark.parametrize('sort_by, value', [
+    ('created_at', datetime(2024, 5, 1, 12, 0, 0, 123456)),
+    ('ter_manual', 4.25),
+    ('views', 1000),
+    ('ter_manual', None)
+])
+@pytest.mark.parametrize('descending', [True, False])
+def test_cursor_round_trip(sort_by, value, descending):
+    token = encode_cursor(sort_by, descending, value, 17)
+    assert '=' not in token
+    assert decode_cursor(token, sort_by, descending) == (value, 17)
+
+
+@pytest.mark.parametrize('sort_by', ['created_at', 'ter_manual', 'views'])
+@pytest.mark.parametrize('order', ['asc', 'desc'])
+def test_pages_cover_full_list(client, sort_by, order):
+    full = [p['id'] for p in client.get('/api/posts', query_string={'sort': sort_by, 'order': order, 'fields': 'id'}).get_json()['posts']]
+
+    ids, cursor = [], None
+    while True:
+        params = {'sort': sort_by, 'order': order, 'fields': 'id', 'limit': 5}
+        if cursor:
+            params['cursor'] = cursor
+        page = client.get('/api/posts', query_string=params).get_json()
+        assert page['total'] == len(full)
+        ids += [p['id'] for p in page['posts']]
+        cursor = page['next_cursor']
+        if not page['has_more']:
+            break
+
+    assert ids == full
+
+
+@pytest.mark.parametrize('sort_by, token', [
+    ('created_at', 'kein-base64!'),
+    ('created_at', make_token({'sort': 'created_at', 'desc': True, 'value': None})),  # ohne id
+    ('created_at', make_token({'sort': 'views', 'desc': True, 'value': 5, 'id': 1})),  # andere Sortierung
+    ('created_at', make_token({'sort': 'created_at', 'desc': True, 'value': {'a': 1}, 'id': 1})),
+    ('created_at', make_token({'sort': 'created_at', 'desc': True, 'value': 12, 'id': 1})),
+    ('created_at', make_token({'sort': 'created_at', 'desc': True, 'value': '2024-13-45', 'id': 1})),
+    ('views', make_token({'sort': 'views', 'desc': True, 'value': {'a': 1}, 'id': 1})),
+    ('views', make_token({'sort': 'views', 'desc': True, 'value': [1, 2], 'id': 1})),
+    ('views', make_token({'sort': 'views', 'desc': True, 'value': '5', 'id': 1})),
+    ('views', make_token({'sort': 'views', 'desc': True, 'value': True, 'id': 1})),
+    ('ter_manual', make_token({'sort': 'ter_manual', 'desc': True, 'value': float('nan'), 'id': 1}))
+])
+def test_invalid_cursor(client, sort_by, token):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token, sort_by, True)
+
+    response = client.get('/api/posts', query_string={'sort': sort_by, 'order': 'desc', 'cursor': token, 'limit': 5})
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
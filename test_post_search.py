@@ -0,0 +1,98 @@
+"""
+Test: Volltextsuche /api/posts/search - FTS5-Index mit Sync-Triggern, Ranking, Präfixsuche,
+twitter.com/x.com-Gleichwertigkeit und ILIKE-Fallback ohne Index
+"""
+import pytest
+
+import app as app_module
+from app import app, db, TwitterPost, normalize_twitter_url
+
+
+@pytest.fixture(scope='module')
+def client():
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    client = app.test_client()
+    session_id = client.post('/api/sessions', json={'name': 'Such-Test'}).get_json()['session']['id']
+    client.post(f'/api/sessions/{session_id}/activate')
+
+    posts = [
+        ('https://x.com/Alice/status/1', 'alice', 'Die Empörung über die Migration wächst', None, False),
+        ('https://twitter.com/bob_99/status/2', 'bob_99', 'Alice sagt nichts dazu', 'empörend', True),
+        ('https://twitter.com/carl/status/3', 'carl', 'Das Wetter ist schön', None, True),
+        ('https://twitter.com/dora/status/4', 'dora', 'Migration Migration Migration', None, True),
+    ]
+    with app.app_context():
+        for url, handle, content, notes, reviewed in posts:
+            db.session.add(TwitterPost(
+                session_id=session_id, twitter_url=url, url_key=normalize_twitter_url(url),
+                twitter_handle=handle, twitter_content=content, notes=notes, is_reviewed=reviewed
+            ))
+        db.session.add(TwitterPost(
+            session_id=session_id, twitter_url='https://twitter.com/eve/status/5', twitter_handle='eve',
+            twitter_content='Migration', trigger_angst_begruendung='Angst vor Überfremdung', is_archived=True
+        ))
+        db.session.commit()
+    yield client
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+def search(client, q, **params):
+    response = client.get('/api/posts/search', query_string={'q': q, 'fields': 'id', **params})
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+
+def ids(result):
+    return [post['id'] for post in result['posts']]
+
+
+def test_ranked_prefix_search(client):
+    result = search(client, 'migr')
+    assert result['ranked']
+    assert ids(result) == [4, 1]  # dreimal "Migration" vor einmal, archivierter Post 5 nicht enthalten
+    assert ids(search(client, 'empor')) == [1, 2]  # Umlaute, Inhalt und Notizen
+    assert ids(search(client, 'mig wächst')) == [1]  # alle Wörter müssen vorkommen
+    assert ids(search(client, '@bob_99')) == [2]
+    assert ids(search(client, 'alice')) == [1, 2]  # Handle wiegt mehr als Erwähnung im Inhalt
+    assert ids(search(client, 'migration', reviewed='true')) == [4]
+
+
+def test_url_search_treats_x_and_twitter_alike(client):
+    assert ids(search(client, 'https://twitter.com/alice/status/1')) == [1]
+    assert ids(search(client, 'https://x.com/Bob_99/status/2?s=20')) == [2]
+    assert ids(search(client, 'x.com/carl')) == [3]
+
+
+def test_index_follows_updates_and_deletes(client):
+    assert client.put('/api/posts/3', json={'notes': 'Migration im Wetterbericht'}).status_code == 200
+    assert 3 in ids(search(client, 'migration'))
+    assert client.put('/api/posts/3', json={'notes': None}).status_code == 200
+    assert 3 not in ids(search(client, 'migration'))
+
+    with app.app_context():
+        db.session.execute(db.text(
+            "INSERT INTO twitter_posts_fts(twitter_posts_fts) VALUES ('integrity-check')"
+        ))
+
+
+def test_like_fallback_without_index(client, monkeypatch):
+    monkeypatch.setattr(app_module, 'post_search_index_available', lambda: False)
+    result = search(client, 'igratio')
+    assert not result['ranked']
+    assert sorted(ids(result)) == [1, 4]
+    assert ids(search(client, 'bob_')) == [2]  # "_" ist kein Platzhalter
+
+
+def test_paging_and_errors(client):
+    first = search(client, 'migration', limit=1)
+    second = search(client, 'migration', limit=1, offset=1)
+    assert first['total'] == second['total'] == 2
+    assert first['has_more'] and not second['has_more']
+    assert ids(first) + ids(second) == [4, 1]
+
+    assert client.get('/api/posts/search').status_code == 400
+    assert search(client, '"*')['total'] == 0
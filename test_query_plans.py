@@ -0,0 +1,133 @@
+"""
+Test: Die Abfragen der Endpoints nutzen Indizes (kein Full Table Scan auf twitter_posts/analysis_jobs)
+
+Die Abfragen werden wie in den Endpoints aufgebaut und mit EXPLAIN QUERY PLAN
+gegen eine In-Memory-Datenbank mit dem Schema aus db.metadata geprüft.
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, select, func
+
+import app as app_module
+from app import (
+    db, TwitterPost, AnalysisJob, POST_SORT_COLUMNS,
+    apply_post_sort, apply_post_search, apply_post_filters, keyset_filter, session_counts_query
+)
+
+CHECKED_TABLES = ('twitter_posts', 'analysis_jobs')
+
+
+@pytest.fixture(scope='module')
+def engine():
+    engine = create_engine('sqlite://')
+    db.metadata.create_all(engine)
+    return engine
+
+
+def query_plan(engine, statement):
+    """EXPLAIN QUERY PLAN für ein SQLAlchemy-Statement (Liste der Plan-Zeilen)"""
+    compiled = statement.compile(dialect=engine.dialect, compile_kwargs={'render_postcompile': True})
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + str(compiled), params).fetchall()
+    return [row[-1] for row in rows]
+
+
+def assert_no_full_scan(engine, statement):
+    plan = query_plan(engine, statement)
+    for line in plan:
+        for table in CHECKED_TABLES:
+            assert not (line.startswith(f'SCAN {table}') and 'INDEX' not in line), '\n'.join(plan)
+
+
+def post_list_statements():
+    """Post-Listen (/api/posts, /api/posts/archived, /api/posts/favorites) für alle Sortierungen"""
+    bases = {
+        'posts': select(TwitterPost).filter_by(session_id=1, is_archived=False),
+        'posts_reviewed': select(TwitterPost).filter_by(session_id=1, is_archived=False, is_reviewed=True),
+        'archived': select(TwitterPost).filter_by(is_archived=True),
+        'favorites': select(TwitterPost).filter_by(is_favorite=True)
+    }
+    for name, base in bases.items():
+        for sort_by in POST_SORT_COLUMNS:
+            for order in ('asc', 'desc'):
+                statement, _, column, descending = apply_post_sort(base, sort_by, order)
+                yield f'{name}-{sort_by}-{order}', statement.limit(101)
+
+                value = datetime(2024, 1, 1) if sort_by == 'created_at' else 5
+                page = statement.filter(keyset_filter(column, descending, value, 100)).limit(101)
+                yield f'{name}-{sort_by}-{order}-cursor', page
+
+
+POST_LIST_STATEMENTS = dict(post_list_statements())
+
+ENDPOINT_STATEMENTS = {
+    # /api/stats, /api/stats/distribution, /api/handles, /api/factcheckers
+    'session_posts': select(TwitterPost).filter_by(session_id=1, is_archived=False),
+    'stats_aggregate': select(func.count(TwitterPost.id), func.sum(TwitterPost.views)).where(TwitterPost.session_id == 1),
+    'stats_top_posts': select(TwitterPost).where(
+        TwitterPost.session_id == 1, TwitterPost.ter_manual.isnot(None)
+    ).order_by(TwitterPost.ter_manual.desc(), TwitterPost.id.asc()).limit(10),
+    # /api/stats/timeline, /api/stats/advanced, PDF/Excel/CSV-Export
+    'reviewed_posts': select(TwitterPost).filter_by(
+        session_id=1, is_reviewed=True, is_archived=False, is_excluded=False
+    ).order_by(TwitterPost.ter_manual.desc().nullslast(), TwitterPost.id),
+    # /api/posts/favorites/export
+    'favorites_export': select(TwitterPost).filter_by(is_favorite=True).order_by(TwitterPost.created_at.desc(), TwitterPost.id.desc()),
+    # Upsert-Import und Trigger/Frame-Abgleich
+    'upsert_prefetch': select(TwitterPost.url_key, TwitterPost.likes).where(
+        TwitterPost.session_id == 1, TwitterPost.url_key.in_(['a', 'b'])
+    ),
+    'url_index': select(TwitterPost.id, TwitterPost.url_key).where(TwitterPost.session_id == 1),
+    # /api/handles, /api/factcheckers (GROUP BY mit Anzahl)
+    'handle_counts': select(TwitterPost.twitter_handle, func.count(TwitterPost.id)).where(
+        TwitterPost.session_id == 1, TwitterPost.is_archived == False, TwitterPost.twitter_handle.isnot(None)
+    ).group_by(TwitterPost.twitter_handle),
+    'factchecker_counts': select(TwitterPost.factcheck_domain, func.count(TwitterPost.id)).where(
+        TwitterPost.session_id == 1, TwitterPost.is_archived == False, TwitterPost.factcheck_domain.isnot(None)
+    ).group_by(TwitterPost.factcheck_domain),
+    'replace_delete_count': select(func.count(TwitterPost.id)).where(TwitterPost.session_id == 1),
+    # Hintergrund-Jobs
+    'find_job': select(AnalysisJob).where(
+        AnalysisJob.session_id == 1, AnalysisJob.kind == 'advanced_stats',
+        AnalysisJob.data_version == 3, AnalysisJob.status.in_(('pending', 'running', 'done'))
+    ).order_by(AnalysisJob.created_at.desc()).limit(1)
+}
+
+
+@pytest.mark.parametrize('name', sorted(POST_LIST_STATEMENTS))
+def test_post_list_uses_index(engine, name):
+    assert_no_full_scan(engine, POST_LIST_STATEMENTS[name])
+
+
+@pytest.mark.parametrize('name', sorted(ENDPOINT_STATEMENTS))
+def test_endpoint_query_uses_index(engine, name):
+    assert_no_full_scan(engine, ENDPOINT_STATEMENTS[name])
+
+
+def test_session_counts_uses_index(engine):
+    """Session-Zähler für einzelne Sessions (get_session, activate_session, ...)"""
+    assert_no_full_scan(engine, session_counts_query([1]))
+
+
+@pytest.mark.parametrize('term', ['migration', 'https://x.com/user/status/1'])
+def test_post_search_uses_index(engine, monkeypatch, term):
+    """/api/posts/search: FTS5-Treffer per rowid, vollständige URLs über url_key"""
+    monkeypatch.setattr(app_module, 'post_search_index_available', lambda: True)
+    statement, _ = apply_post_search(select(TwitterPost).filter_by(session_id=1, is_archived=False), term)
+    assert_no_full_scan(engine, statement)
+
+
+@pytest.mark.parametrize('params', [
+    {'reviewed': 'true', 'excluded': 'false'},
+    {'handles': 'alice,bob'},
+    {'date_from': '2023-01-01', 'date_to': '2023-06-30'},
+    {'reviewed': 'true', 'handles': 'alice', 'ter_min': '1', 'views_max': '1000', 'triggers': 'angst', 'frames': 'moral'},
+    {'factcheckers': 'correctiv.org', 'favorite': 'true'}
+])
+def test_post_filters_use_index(engine, params):
+    """/api/posts mit Filter-Parametern (apply_post_filters), Standard-Sortierung und Seitengröße"""
+    base = select(TwitterPost).filter_by(session_id=1, is_archived=False)
+    statement, _, _, _ = apply_post_sort(apply_post_filters(base, params), 'created_at', 'desc')
+    assert_no_full_scan(engine, statement.limit(101))
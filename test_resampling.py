@@ -0,0 +1,193 @@
+"""
+Test: Resampling-Tests der erweiterten Analyse - Permutations-p-Werte und Bootstrap-Intervalle
+stimmen mit scipy überein, sind reproduzierbar und unabhängig von Chunks und Worker-Anzahl
+"""
+import json
+import uuid
+
+import numpy as np
+import pytest
+from scipy import stats as scipy_stats
+
+import app as app_module
+from app import (
+    app, db, TwitterPost, AnalysisSession, AnalysisJob, ADVANCED_STATS_COLUMNS,
+    compute_resampling_stats, run_resampling, compute_advanced_stats_from_data
+)
+
+TRIGGER_NAMES = ['Angst', 'Wut', 'Empörung', 'Ekel', 'Identitätsbezug', 'Hoffnung/Stolz']
+FRAME_NAMES = ['Opfer-Täter Frame', 'Bedrohungs-Frame', 'Verschwörungs-Frame', 'Moral-Frame', 'Historischer Frame']
+
+
+def sample_data(n=200, seed=1):
+    rng = np.random.default_rng(seed)
+    triggers = {name: rng.integers(0, 6, n) for name in TRIGGER_NAMES}
+    frames = {name: (rng.random(n) < 0.3).astype(int) for name in FRAME_NAMES}
+    # Schiefe TER-Verteilung, nur Angst und Bedrohungs-Frame wirken
+    ter = rng.gamma(1.5, 2.0, n) + 0.8 * triggers['Angst'] + 2.0 * frames['Bedrohungs-Frame']
+    return ter, triggers, frames
+
+
+def options(**overrides):
+    return {'iterations': 2000, 'seed': 7, 'workers': 1, **overrides}
+
+
+def test_matches_parametric_results():
+    ter, triggers, frames = sample_data()
+    result = compute_resampling_stats(ter, triggers, frames, options())
+
+    assert set(result['correlations']) == set(TRIGGER_NAMES + FRAME_NAMES)
+    for name, values in {**triggers, **frames}.items():
+        corr, p_value = scipy_stats.pearsonr(values, ter)
+        entry = result['correlations'][name]
+        assert entry['correlation'] == round(float(corr), 3)
+        assert abs(entry['p_value'] - p_value) < 0.05 or (p_value < 0.001 and entry['p_value'] < 0.002)
+        assert entry['ci_low'] <= entry['correlation'] <= entry['ci_high']
+
+    assert result['correlations']['Angst']['significant']
+    threat = result['group_differences']['Bedrohungs-Frame']
+    assert threat['kind'] == 'frame' and threat['significant']
+    assert threat['ci_low'] < threat['difference'] < threat['ci_high']
+    assert threat['count_with'] + threat['count_without'] == len(ter)
+
+
+def test_group_difference_matches_scipy_permutation_test():
+    ter, triggers, frames = sample_data(n=120, seed=3)
+    mask = frames['Moral-Frame'] == 1
+    result = compute_resampling_stats(ter, triggers, frames, options(iterations=4000))
+
+    reference = scipy_stats.permutation_test(
+        (ter[mask], ter[~mask]), lambda a, b: np.mean(a) - np.mean(b),
+        n_resamples=4000, random_state=0
+    )
+    assert abs(result['group_differences']['Moral-Frame']['p_value'] - reference.pvalue) < 0.04
+
+
+def test_reproducible_and_independent_of_chunks(monkeypatch):
+    ter, triggers, frames = sample_data()
+    first = compute_resampling_stats(ter, triggers, frames, options())
+    assert compute_resampling_stats(ter, triggers, frames, options()) == first
+    assert compute_resampling_stats(ter, triggers, frames, options(seed=8)) != first
+
+    # Viele kleine Chunks, einmal seriell und einmal im Prozess-Pool: identisches Ergebnis
+    monkeypatch.setattr(app_module, 'RESAMPLING_CHUNK_ELEMENTS', len(ter) * 300)
+    serial = compute_resampling_stats(ter, triggers, frames, options())
+    parallel = compute_resampling_stats(ter, triggers, frames, options(workers=2))
+    assert serial == parallel
+    assert serial['iterations'] == 2000
+
+
+def test_small_groups_are_skipped():
+    ter, triggers, frames = sample_data(n=30)
+    frames['Historischer Frame'][:] = 0
+    frames['Historischer Frame'][0] = 1
+    result = compute_resampling_stats(ter, triggers, frames, options())
+
+    assert 'Historischer Frame' not in result['group_differences']  # nur 1 Post mit Frame
+    assert 'Historischer Frame' in result['correlations']
+
+
+def advanced_stats_data(n):
+    ter, triggers, frames = sample_data(n=n)
+    columns = dict(zip(
+        ADVANCED_STATS_COLUMNS,
+        [ter] + [triggers[name] for name in TRIGGER_NAMES] + [frames[name] for name in FRAME_NAMES]
+    ))
+    return {column: values.tolist() for column, values in columns.items()}
+
+
+def test_advanced_stats_contains_resampling():
+    data = advanced_stats_data(40)
+    data['resampling'] = options(iterations=500)
+
+    result = compute_advanced_stats_from_data(data)
+    assert result['resampling']['iterations'] == 500
+    assert set(result['resampling']['correlations']) == set(result['correlations'])
+    assert {c['frame'] for c in result['group_comparisons']} <= set(result['resampling']['group_differences'])
+
+
+def test_advanced_stats_without_resampling_options():
+    result = compute_advanced_stats_from_data(advanced_stats_data(40))
+    assert result['resampling'] is None
+    assert result['correlations']
+
+
+def test_sync_endpoint_resampling_is_opt_in(monkeypatch):
+    """/api/stats/advanced bleibt ohne Resampling (Kosten wie bisher), ?resampling=1 rechnet es seriell"""
+    monkeypatch.setitem(app.config, 'RESAMPLING_ITERATIONS', 300)
+    monkeypatch.setitem(app.config, 'RESAMPLING_PARALLEL_MIN_POSTS', 1)  # im Request trotzdem kein Prozess-Pool
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    client = app.test_client()
+    session_id = client.post('/api/sessions', json={'name': 'Resampling'}).get_json()['session']['id']
+    client.post(f'/api/sessions/{session_id}/activate')
+    with app.app_context():
+        data = advanced_stats_data(30)
+        for i in range(30):
+            db.session.add(TwitterPost(
+                session_id=session_id, twitter_url=f'https://twitter.com/u/status/{i}', is_reviewed=True,
+                **{column: data[column][i] for column in ADVANCED_STATS_COLUMNS}
+            ))
+        db.session.commit()
+
+    workers_used = []
+
+    def counting_run_resampling(ter_values, features, groups, iterations, seed, workers=1):
+        workers_used.append(workers)
+        return run_resampling(ter_values, features, groups, iterations, seed, workers)
+    monkeypatch.setattr(app_module, 'run_resampling', counting_run_resampling)
+    try:
+        assert client.get('/api/stats/advanced').get_json()['resampling'] is None
+        assert workers_used == []
+
+        result = client.get('/api/stats/advanced', query_string={'resampling': 1}).get_json()
+        assert result['resampling']['iterations'] == 300
+        assert workers_used == [1]
+    finally:
+        with app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+
+@pytest.mark.parametrize('iterations', [1, 7])
+def test_few_iterations(iterations):
+    ter, triggers, frames = sample_data(n=20)
+    result = compute_resampling_stats(ter, triggers, frames, options(iterations=iterations))
+    assert all(0 < entry['p_value'] <= 1 for entry in result['correlations'].values())
+
+
+def test_sync_endpoint_prefers_finished_job():
+    """Ein fertiger Job ersetzt das (ohne Resampling) gecachte Ergebnis derselben data_version"""
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    client = app.test_client()
+    session_id = client.post('/api/sessions', json={'name': 'Job-Ergebnis'}).get_json()['session']['id']
+    client.post(f'/api/sessions/{session_id}/activate')
+    with app.app_context():
+        data = advanced_stats_data(20)
+        for i in range(20):
+            db.session.add(TwitterPost(
+                session_id=session_id, twitter_url=f'https://twitter.com/u/status/{i}', is_reviewed=True,
+                **{column: data[column][i] for column in ADVANCED_STATS_COLUMNS}
+            ))
+        db.session.commit()
+
+    try:
+        cached = client.get('/api/stats/advanced').get_json()
+        assert cached['resampling'] is None
+
+        with app.app_context():
+            session = db.session.get(AnalysisSession, session_id)
+            db.session.add(AnalysisJob(
+                id=uuid.uuid4().hex, session_id=session_id, kind='advanced_stats', data_version=session.data_version or 0,
+                status='done', result=json.dumps({**cached, 'resampling': {'iterations': 123}})
+            ))
+            db.session.commit()
+
+        assert client.get('/api/stats/advanced').get_json()['resampling'] == {'iterations': 123}
+    finally:
+        with app.app_context():
+            db.session.remove()
+            db.drop_all()
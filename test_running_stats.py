@@ -0,0 +1,186 @@
+"""
+Test: Laufende Statistik (/api/stats/running) - nach jeder Bearbeitung per Differenz aktualisiert und
+identisch mit der vollständigen Neuberechnung (/api/stats, /api/stats/distribution, Neuaufbau)
+"""
+import random
+from types import SimpleNamespace
+
+import pytest
+
+import app as app_module
+from app import app, db, TwitterPost, RUNNING_STATS, RUNNING_STATS_TRIGGER_FRAME_COLUMNS, bump_data_version
+
+
+@pytest.fixture(scope='module')
+def client():
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    RUNNING_STATS.clear()
+    client = app.test_client()
+    session_id = client.post('/api/sessions', json={'name': 'Laufende Statistik'}).get_json()['session']['id']
+    client.post(f'/api/sessions/{session_id}/activate')
+
+    rnd = random.Random(5)
+    with app.app_context():
+        for i in range(80):
+            db.session.add(TwitterPost(
+                session_id=session_id, twitter_url=f'https://twitter.com/user{i}/status/{i}',
+                ter_automatic=rnd.choice([0.0, 0.4, 3.75, 8.2, 16.0, 60.5, 120.0]),
+                ter_manual=rnd.choice([None, 0.0, 2.5, 7.33, 12.0, 19.99]),
+                views=rnd.randint(0, 100000), views_manual=rnd.choice([None, None, 500]),
+                likes=rnd.randint(0, 500), retweets=rnd.randint(0, 50), replies=rnd.randint(0, 50),
+                bookmarks=rnd.randint(0, 20), quotes=rnd.randint(0, 10), twitter_followers=rnd.choice([0, 10, 25000]),
+                trigger_angst=rnd.choice([0, 0, 3]), trigger_wut=rnd.choice([0, 2]), trigger_hoffnung=rnd.choice([0, 1]),
+                frame_moral=rnd.choice([0, 1]), frame_bedrohung=rnd.choice([0, 1]),
+                is_reviewed=rnd.random() < 0.7, is_excluded=rnd.random() < 0.1, is_archived=rnd.random() < 0.1
+            ))
+        db.session.commit()
+    yield client
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+    RUNNING_STATS.clear()
+
+
+def co_occurrence_reference(client):
+    posts = client.get('/api/posts', query_string={'fields': 'full'}).get_json()['posts']
+    posts += client.get('/api/posts/archived', query_string={'fields': 'full'}).get_json()['posts']
+    counts = [[0] * len(RUNNING_STATS_TRIGGER_FRAME_COLUMNS) for _ in RUNNING_STATS_TRIGGER_FRAME_COLUMNS]
+    for post in posts:
+        if post['is_reviewed'] and not post['is_archived'] and not post['is_excluded']:
+            present = [i for i, column in enumerate(RUNNING_STATS_TRIGGER_FRAME_COLUMNS) if post[column] > 0]
+            for i in present:
+                for j in present:
+                    counts[i][j] += 1
+    return counts
+
+
+def assert_matches_full_recompute(client, running):
+    full = client.get('/api/stats').get_json()
+    for key in ('total_posts', 'reviewed_posts', 'unreviewed_posts', 'archived_posts', 'ter_interpretation_distribution'):
+        assert running[key] == full[key], key
+    for name in app_module.RUNNING_STATS_METRICS:
+        if full[name] is None:
+            assert running[name] is None
+            continue
+        assert running[name]['count'] == full[name]['count'], name
+        for key in ('mean', 'stdev', 'sum'):
+            assert running[name][key] == pytest.approx(full[name][key], abs=0.011), (name, key)
+
+    assert running['ter_distribution'] == client.get('/api/stats/distribution').get_json()['ter_distribution']
+    assert running['co_occurrence']['counts'] == co_occurrence_reference(client)
+
+
+def test_initial_build_matches_full_recompute(client):
+    running = client.get('/api/stats/running').get_json()
+    assert running['reviewed_posts'] > 20
+    assert_matches_full_recompute(client, running)
+
+
+def test_post_edits_update_by_delta(client, monkeypatch):
+    client.get('/api/stats/running')  # aktueller Stand im Speicher
+    rebuilds = []
+    rebuild = app_module.rebuild_running_stats
+    monkeypatch.setattr(app_module, 'rebuild_running_stats', lambda session: rebuilds.append(1) or rebuild(session))
+
+    rnd = random.Random(9)
+    ids = [p['id'] for p in client.get('/api/posts', query_string={'fields': 'id'}).get_json()['posts']]
+    edits = [
+        lambda: {'ter_manual': rnd.choice([None, 0, 4.99, 5, 14.5, 30])},
+        lambda: {'is_reviewed': rnd.random() < 0.5},
+        lambda: {'is_excluded': rnd.random() < 0.5},
+        lambda: {'is_archived': rnd.random() < 0.3},
+        lambda: {'views_manual': rnd.choice([None, 0, 123456])},
+        lambda: {'trigger_ekel': rnd.choice([0, 4]), 'frame_historisch': rnd.choice([0, 1])},
+    ]
+    for step in range(30):
+        post_id = rnd.choice(ids)
+        assert client.put(f'/api/posts/{post_id}', json=rnd.choice(edits)()).status_code == 200
+        if step % 10 == 9:
+            assert_matches_full_recompute(client, client.get('/api/stats/running').get_json())
+
+    assert client.delete(f'/api/posts/{ids[0]}').status_code == 200
+    running = client.get('/api/stats/running').get_json()
+    assert_matches_full_recompute(client, running)
+    assert rebuilds == []  # nur Differenzen, kein Neuaufbau
+
+    rebuilt = client.get('/api/stats/running', query_string={'rebuild': 1}).get_json()
+    assert rebuilt == running
+    assert rebuilds == [1]
+
+
+def test_other_write_paths_trigger_rebuild(client):
+    before = client.get('/api/stats/running').get_json()
+
+    # Schreibpfad ohne Differenz (z.B. Import): nur data_version steigt
+    with app.app_context():
+        post = TwitterPost.query.filter_by(is_reviewed=True, is_archived=False, is_excluded=False).first()
+        post.is_reviewed = False
+        bump_data_version(post.session_id)
+        db.session.commit()
+
+    after = client.get('/api/stats/running').get_json()
+    assert after['data_version'] == before['data_version'] + 1
+    assert after['reviewed_posts'] == before['reviewed_posts'] - 1
+    assert_matches_full_recompute(client, after)
+
+
+def test_interleaved_edits_drop_stale_delta(client, monkeypatch):
+    """
+    Zweite Bearbeitung desselben Posts wird zwischen Snapshot und Commit der ersten committet:
+    deren old_row ist veraltet - die Statistik wird verworfen und neu aufgebaut statt falsch verrechnet
+    """
+    before = client.get('/api/stats/running').get_json()
+    with app.app_context():
+        post = TwitterPost.query.filter_by(is_reviewed=True, is_archived=False, is_excluded=False).first()
+        post_id, session_id = post.id, post.session_id
+
+    other_client = app.test_client()
+    bump = app_module.bump_data_version
+    interleaved = []
+
+    def bump_after_other_edit(bumped_session_id):
+        if not interleaved:
+            interleaved.append(1)
+            assert other_client.put(f'/api/posts/{post_id}', json={'is_reviewed': False}).status_code == 200
+        bump(bumped_session_id)
+    monkeypatch.setattr(app_module, 'bump_data_version', bump_after_other_edit)
+
+    rebuilds = []
+    rebuild = app_module.rebuild_running_stats
+    monkeypatch.setattr(app_module, 'rebuild_running_stats', lambda session: rebuilds.append(1) or rebuild(session))
+
+    assert client.put(f'/api/posts/{post_id}', json={'ter_manual': 42.0}).status_code == 200
+    assert interleaved == [1]
+    assert session_id not in RUNNING_STATS  # veraltete Differenz nicht angewendet
+
+    running = client.get('/api/stats/running').get_json()
+    assert rebuilds == [1]
+    assert running['data_version'] == before['data_version'] + 2
+    assert running['reviewed_posts'] == before['reviewed_posts'] - 1
+    assert_matches_full_recompute(client, running)
+
+
+def test_rebuild_during_edit_is_not_counted_twice(client, monkeypatch):
+    """
+    Neuaufbau zwischen Commit und Differenz einer Bearbeitung, mit einer vor dem Commit gelesenen Session:
+    die Änderung steckt schon in den gescannten Posts und darf nicht noch einmal verrechnet werden
+    """
+    with app.app_context():
+        post = TwitterPost.query.filter_by(is_reviewed=True, is_archived=False, is_excluded=False).first()
+        post_id, session_id = post.id, post.session_id
+        stale_session = SimpleNamespace(id=session_id, data_version=post.session.data_version)
+    client.get('/api/stats/running')
+
+    apply_delta = app_module.apply_running_stats_delta
+
+    def rebuild_before_delta(*args):
+        app_module.rebuild_running_stats(stale_session)
+        apply_delta(*args)
+    monkeypatch.setattr(app_module, 'apply_running_stats_delta', rebuild_before_delta)
+
+    assert client.put(f'/api/posts/{post_id}', json={'ter_manual': 55.5}).status_code == 200
+    running = client.get('/api/stats/running').get_json()
+    assert running == client.get('/api/stats/running', query_string={'rebuild': 1}).get_json()
+    assert_matches_full_recompute(client, running)
@@ -0,0 +1,91 @@
+"""
+Test: Statistik-Cache pro data_version - gleichzeitige Zugriffe aus mehreren Threads und
+Neuberechnungs-Skripte, die die data_version erhöhen
+"""
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import app as app_module
+from app import app, db, TwitterPost, AnalysisSession, STATS_CACHE, get_cached_stats
+from recalculate_manual_ter import recalculate_manual_ter
+from recalculate_ter_values import recalculate_all_ter
+
+
+@pytest.fixture
+def client():
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    STATS_CACHE.clear()
+    client = app.test_client()
+    session_id = client.post('/api/sessions', json={'name': 'Cache'}).get_json()['session']['id']
+    client.post(f'/api/sessions/{session_id}/activate')
+    yield client, session_id
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+    STATS_CACHE.clear()
+
+
+def data_version(session_id):
+    with app.app_context():
+        return db.session.get(AnalysisSession, session_id).data_version or 0
+
+
+def test_recalculate_scripts_invalidate_cache(client):
+    client, session_id = client
+    with app.app_context():
+        for i in range(5):
+            db.session.add(TwitterPost(
+                session_id=session_id, twitter_url=f'https://twitter.com/u/status/{i}', is_reviewed=True,
+                likes=100 * (i + 1), views=10000, ter_automatic=0.5, ter_manual=1.0
+            ))
+        db.session.commit()
+
+    before = client.get('/api/stats').get_json()
+    version = data_version(session_id)
+
+    recalculate_all_ter()
+    assert data_version(session_id) == version + 1
+    after = client.get('/api/stats').get_json()
+    assert after['ter_automatic']['mean'] != before['ter_automatic']['mean']
+
+    recalculate_manual_ter()
+    assert data_version(session_id) == version + 2
+    assert client.get('/api/stats').get_json()['ter_manual']['mean'] == after['ter_automatic']['mean']
+
+
+def test_concurrent_access(monkeypatch):
+    """Lesen, Verdrängen (LRU) und Verwerfen gleichzeitig - ohne KeyError"""
+    monkeypatch.setitem(app.config, 'STATS_CACHE_SESSIONS', 3)
+    STATS_CACHE.clear()
+    errors = []
+
+    def reader(offset):
+        try:
+            for i in range(2000):
+                session = SimpleNamespace(id=(i + offset) % 6, data_version=i % 2)
+                assert get_cached_stats('test', session, lambda s: s.id) == session.id
+        except Exception as e:
+            errors.append(e)
+
+    def invalidator():
+        try:
+            for i in range(4000):
+                with app_module.STATS_CACHE_LOCK:
+                    STATS_CACHE.pop(i % 6, None)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=reader, args=(offset,)) for offset in range(4)]
+    threads.append(threading.Thread(target=invalidator))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(STATS_CACHE) <= 3
+    STATS_CACHE.clear()
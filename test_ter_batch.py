@@ -0,0 +1,60 @@
+"""
+Test: TERCalculator.calculate_batch liefert exakt dieselben Werte wie calculate()
+"""
+import math
+
+import numpy as np
+
+from app import TERCalculator
+
+
+def assert_batch_matches_scalar(likes, bookmarks, replies, retweets, quotes, views):
+    batch = TERCalculator.calculate_batch(likes, bookmarks, replies, retweets, quotes, views)
+
+    for i in range(len(views)):
+        scalar = TERCalculator.calculate(
+            likes=int(likes[i]),
+            bookmarks=int(bookmarks[i]),
+            replies=int(replies[i]),
+            retweets=int(retweets[i]),
+            quotes=int(quotes[i]),
+            views=int(views[i])
+        )
+        assert batch['ter_sqrt'][i] == scalar['ter_sqrt']
+        assert batch['ter_linear'][i] == scalar['ter_linear']
+        assert batch['weighted_engagement'][i] == scalar['weighted_engagement']
+        assert batch['total_interactions'][i] == scalar['total_interactions']
+        assert batch['engagement_level_code'][i] == scalar['engagement_level_code']
+        assert batch['engagement_level'][i] == scalar['engagement_level']
+
+
+def test_batch_matches_scalar_random():
+    """Zufällige Engagement-Werte inkl. Posts ohne Views"""
+    rng = np.random.default_rng(42)
+    n = 20000
+    columns = [rng.integers(0, 5000, n) for _ in range(5)]
+    views = rng.integers(0, 2_000_000, n)
+    views[::50] = 0
+
+    assert_batch_matches_scalar(*columns, views)
+
+
+def test_batch_matches_scalar_rounding_ties():
+    """Kleine Werte erzeugen viele Gleichstände beim Runden auf 2 Nachkommastellen"""
+    weighted = np.repeat(np.arange(0, 200), 800)
+    views = np.tile(np.arange(0, 800), 200)
+    zeros = np.zeros_like(weighted)
+
+    assert_batch_matches_scalar(weighted, zeros, zeros, zeros, zeros, views)
+
+
+def test_batch_level_thresholds():
+    """Schwellenwerte 5/10/15 werden wie im Skalar-Pfad auf dem ungerundeten TER√ angewendet"""
+    # weighted / sqrt(100) = weighted / 10 -> TER√ genau 4.9, 5, 9.9, 10, 14.9, 15
+    likes = np.array([49, 50, 99, 100, 149, 150])
+    views = np.full(len(likes), 100)
+    zeros = np.zeros_like(likes)
+
+    batch = TERCalculator.calculate_batch(likes, zeros, zeros, zeros, zeros, views)
+    expected = [TERCalculator.get_engagement_level(like_count / math.sqrt(100))['code'] for like_count in likes]
+    assert batch['engagement_level_code'].tolist() == expected
@@ -0,0 +1,27 @@
+"""
+Test: parse_twitter_date erkennt die Datumsformate aus den CSV-Exporten
+"""
+from datetime import datetime
+
+import pytest
+
+from app import parse_twitter_date
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2022-12-22T13:13:09.000Z', datetime(2022, 12, 22, 13, 13, 9)),
+    ('2022-12-22T13:13:09Z', datetime(2022, 12, 22, 13, 13, 9)),
+    ('2022-12-31T23:30:00+02:00', datetime(2022, 12, 31, 23, 30)),  # Ortszeit, Zeitzone entfernt
+    ('12.03.2022', datetime(2022, 3, 12)),
+    ('1.2.2020', datetime(2020, 2, 1)),
+    ('2023-05-07', datetime(2023, 5, 7)),
+    (' 2023-05-07 ', datetime(2023, 5, 7)),
+    ('02/01/2020', datetime(2020, 1, 2)),
+])
+def test_known_formats(value, expected):
+    assert parse_twitter_date(value) == expected
+
+
+@pytest.mark.parametrize('value', [None, '', '   ', 'unbekannt', '31.02.2020', '2023-13-01', 'Tue Jan 1', '2023-05'])
+def test_invalid_values(value):
+    assert parse_twitter_date(value) is None
@@ -4,9 +4,11 @@ Matches posts via Twitter URL and updates the database
 """
 
 import pandas as pd
-import sqlite3
 import sys
 from urllib.parse import urlparse, parse_qs
+from sqlalchemy import text
+
+from app import app, db
 
 # Fix encoding for Windows console
 if sys.platform == 'win32':
@@ -38,7 +40,6 @@ def normalize_twitter_url(url):
 
 def main():
     excel_path = r'C:\Users\Jason\Desktop\Masterarbeit\Finalendergebnis\trigger_frame_results_20251112_194157.xlsx'
-    db_path = r'C:\Users\Jason\Desktop\Masterarbeit\Twitter-Auswertung\instance\twitter_ter.db'
 
     print("=" * 80)
     print("EMPÖRUNG-UPDATE AUS EXCEL-DATEI")
@@ -86,10 +87,10 @@ def main():
     print(f"   ✓ {len(excel_data)} URLs normalisiert und vorbereitet")
 
     # Connect to database
-    print(f"\n3. Verbinde mit Datenbank: {db_path}")
+    # Gleiche Datenbank wie die App (DATABASE_URL, Standard: instance/twitter_ter.db)
+    print(f"\n3. Verbinde mit Datenbank: {db.engine.url.render_as_string(hide_password=True)}")
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        conn = db.engine.connect()
         print("   ✓ Verbindung hergestellt")
     except Exception as e:
         print(f"   ✗ Fehler bei Datenbankverbindung: {e}")
@@ -97,8 +98,7 @@ def main():
 
     # Get all posts from database
     print("\n4. Lade Posts aus Datenbank...")
-    cursor.execute("SELECT id, twitter_url, trigger_empoerung, is_reviewed, is_excluded FROM twitter_posts")
-    db_posts = cursor.fetchall()
+    db_posts = conn.execute(text("SELECT id, twitter_url, trigger_empoerung, is_reviewed, is_excluded FROM twitter_posts")).fetchall()
     print(f"   ✓ {len(db_posts)} Posts geladen")
 
     # Match and update
@@ -122,12 +122,12 @@ def main():
             # Check if update is needed
             if current_empoerung != new_score:
                 # Update the database
-                cursor.execute("""
+                conn.execute(text("""
                     UPDATE twitter_posts
-                    SET trigger_empoerung = ?,
-                        trigger_empoerung_begruendung = ?
-                    WHERE id = ?
-                """, (new_score, new_begr, post_id))
+                    SET trigger_empoerung = :score,
+                        trigger_empoerung_begruendung = :begruendung
+                    WHERE id = :post_id
+                """), {'score': new_score, 'begruendung': new_begr, 'post_id': post_id})
 
                 updated += 1
                 update_log.append({
@@ -180,13 +180,13 @@ def main():
     print("\n" + "=" * 80)
     print("VERIFIKATION DER 69 WICHTIGEN POSTS")
     print("=" * 80)
-    cursor.execute("""
+    rows = conn.execute(text("""
         SELECT COUNT(*),
                SUM(CASE WHEN trigger_empoerung > 0 THEN 1 ELSE 0 END) as with_empoerung
         FROM twitter_posts
-        WHERE is_reviewed = 1 AND is_excluded = 0
-    """)
-    result = cursor.fetchone()
+        WHERE is_reviewed = TRUE AND is_excluded = FALSE
+    """))
+    result = rows.fetchone()
     important_count = result[0]
     important_with_empoerung = result[1]
 
@@ -197,12 +197,12 @@ def main():
     print("\n" + "=" * 80)
     print("VERIFIKATION ALLER POSTS")
     print("=" * 80)
-    cursor.execute("""
+    rows = conn.execute(text("""
         SELECT COUNT(*),
                SUM(CASE WHEN trigger_empoerung > 0 THEN 1 ELSE 0 END) as with_empoerung
         FROM twitter_posts
-    """)
-    result = cursor.fetchone()
+    """))
+    result = rows.fetchone()
     all_count = result[0]
     all_with_empoerung = result[1]
 
@@ -213,26 +213,26 @@ def main():
     print("\n" + "=" * 80)
     print("EMPÖRUNG-VERTEILUNG (alle Posts)")
     print("=" * 80)
-    cursor.execute("""
+    rows = conn.execute(text("""
         SELECT trigger_empoerung, COUNT(*) as count
         FROM twitter_posts
         GROUP BY trigger_empoerung
         ORDER BY trigger_empoerung
-    """)
-    for score, count in cursor.fetchall():
+    """))
+    for score, count in rows.fetchall():
         print(f"Score {score}: {count} Posts")
 
     print("\n" + "=" * 80)
     print("EMPÖRUNG-VERTEILUNG (69 wichtige Posts)")
     print("=" * 80)
-    cursor.execute("""
+    rows = conn.execute(text("""
         SELECT trigger_empoerung, COUNT(*) as count
         FROM twitter_posts
-        WHERE is_reviewed = 1 AND is_excluded = 0
+        WHERE is_reviewed = TRUE AND is_excluded = FALSE
         GROUP BY trigger_empoerung
         ORDER BY trigger_empoerung
-    """)
-    for score, count in cursor.fetchall():
+    """))
+    for score, count in rows.fetchall():
         print(f"Score {score}: {count} Posts")
 
     conn.close()
@@ -241,4 +241,5 @@ def main():
     print("=" * 80)
 
 if __name__ == '__main__':
-    main()
+    with app.app_context():
+        main()
@@ -1,11 +1,14 @@
 import sys
-import sqlite3
+from sqlalchemy import text
+
+from app import app, db
 
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
-conn = sqlite3.connect(r'C:\Users\Jason\Desktop\Masterarbeit\Twitter-Auswertung\instance\twitter_ter.db')
-cursor = conn.cursor()
+# Gleiche Datenbank wie die App (DATABASE_URL, Standard: instance/twitter_ter.db)
+app.app_context().push()
+conn = db.engine.connect()
 
 print("=" * 80)
 print("EMPÖRUNG-STATISTIKEN NACH UPDATE")
@@ -13,42 +16,42 @@ print("=" * 80)
 
 print("\n80 POSTS (is_reviewed = 1):")
 print("-" * 80)
-cursor.execute('''
+result = conn.execute(text('''
     SELECT trigger_empoerung, COUNT(*)
     FROM twitter_posts
-    WHERE is_reviewed = 1
+    WHERE is_reviewed = TRUE
     GROUP BY trigger_empoerung
     ORDER BY trigger_empoerung
-''')
-for score, count in cursor.fetchall():
+'''))
+for score, count in result.fetchall():
     print(f'  Score {score}: {count} Posts')
 
-cursor.execute('''
+result = conn.execute(text('''
     SELECT COUNT(*), SUM(CASE WHEN trigger_empoerung > 0 THEN 1 ELSE 0 END)
     FROM twitter_posts
-    WHERE is_reviewed = 1
-''')
-total, with_emp = cursor.fetchone()
+    WHERE is_reviewed = TRUE
+'''))
+total, with_emp = result.fetchone()
 print(f'\n  Total: {total}, Mit Empörung > 0: {with_emp}')
 
 print("\n69 POSTS (is_reviewed = 1 AND is_excluded = 0):")
 print("-" * 80)
-cursor.execute('''
+result = conn.execute(text('''
     SELECT trigger_empoerung, COUNT(*)
     FROM twitter_posts
-    WHERE is_reviewed = 1 AND is_excluded = 0
+    WHERE is_reviewed = TRUE AND is_excluded = FALSE
     GROUP BY trigger_empoerung
     ORDER BY trigger_empoerung
-''')
-for score, count in cursor.fetchall():
+'''))
+for score, count in result.fetchall():
     print(f'  Score {score}: {count} Posts')
 
-cursor.execute('''
+result = conn.execute(text('''
     SELECT COUNT(*), SUM(CASE WHEN trigger_empoerung > 0 THEN 1 ELSE 0 END)
     FROM twitter_posts
-    WHERE is_reviewed = 1 AND is_excluded = 0
-''')
-total, with_emp = cursor.fetchone()
+    WHERE is_reviewed = TRUE AND is_excluded = FALSE
+'''))
+total, with_emp = result.fetchone()
 print(f'\n  Total: {total}, Mit Empörung > 0: {with_emp}')
 
 conn.close()